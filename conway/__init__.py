@@ -1,9 +1,12 @@
 import argparse
 import sys
 import time
-from typing import IO, Iterator
+from typing import IO, Iterator, Optional, Tuple
 
+from conway.cycles import CycleDetector
 from conway.grid import BaseGrid
+from conway.metrics import Metrics
+from conway.terminal import DiffRenderer
 
 DEFAULT_TURNS = -1
 DEFAULT_DELAY = 0.35
@@ -17,43 +20,160 @@ def run(
     delay: float = DEFAULT_DELAY,
     sep: str = DEFAULT_SEP,
     out: IO = DEFAULT_OUTFILE,
+    metrics: Optional[Metrics] = None,
+    stats: bool = False,
+    diff: bool = False,
+    cycles: Optional[CycleDetector] = None,
 ):
     """Run the Game of Life to completion.
 
+    If `metrics` is given, each tick and render is measured with it. If
+    `stats` is true, each frame is followed by a `status` line. If `diff` is
+    true, `out` is treated as an ANSI terminal and each frame is drawn over
+    the last one with a `DiffRenderer`, instead of printing every frame in
+    full after `sep`. If `cycles` is given, the Game stops as soon as it
+    repeats itself, and the repetition is left in `cycles.cycle`.
+
     See the ``--help`` output for details.
     """
-    render(grid, sep, out)
+    if diff:
+        renderer = DiffRenderer(out)
+
+        def show():
+            renderer.render(grid, status(grid) if stats else None)
+
+    else:
+
+        def show():
+            render(grid, sep, out, stats)
+
+    show()
+    if cycles is not None:
+        cycles.check(grid)
     time.sleep(delay)
 
     while turns:
-        grid.tick()
-        render(grid, sep, out)
+        if metrics is not None:
+            tick_stats = metrics.tick(grid)
+            with metrics.time_render(tick_stats):
+                show()
+            metrics.record(tick_stats)
+        else:
+            grid.tick()
+            show()
+        if cycles is not None and cycles.check(grid):
+            break
         time.sleep(delay)
         turns -= 1
 
 
+def fast_forward(
+    grid: BaseGrid,
+    turns: int = DEFAULT_TURNS,
+    every: int = 0,
+    sep: str = DEFAULT_SEP,
+    out: IO = DEFAULT_OUTFILE,
+    metrics: Optional[Metrics] = None,
+    stats: bool = False,
+    cycles: Optional[CycleDetector] = None,
+) -> Tuple[int, float]:
+    """Advance the Game as fast as possible, without sleeping between turns.
+
+    If `every` is positive, every `every`-th generation is rendered to
+    `out`; otherwise nothing is rendered. Returns the number of generations
+    advanced and the number of seconds it took, so the caller can report a
+    rate.
+
+    See the `run` method for the other arguments.
+    """
+    generation = 0
+    start = time.perf_counter()
+    if cycles is not None:
+        cycles.check(grid)
+    while turns:
+        generation += 1
+        if metrics is not None:
+            tick_stats = metrics.tick(grid)
+            if every > 0 and generation % every == 0:
+                with metrics.time_render(tick_stats):
+                    render(grid, sep, out, stats)
+            metrics.record(tick_stats)
+        else:
+            grid.tick()
+            if every > 0 and generation % every == 0:
+                render(grid, sep, out, stats)
+        if cycles is not None and cycles.check(grid):
+            break
+        turns -= 1
+    return generation, time.perf_counter() - start
+
+
 def run_iter(
-    grid: BaseGrid, sep: str = DEFAULT_SEP, turns: int = DEFAULT_TURNS
+    grid: BaseGrid,
+    sep: str = DEFAULT_SEP,
+    turns: int = DEFAULT_TURNS,
+    metrics: Optional[Metrics] = None,
+    stats: bool = False,
+    cycles: Optional[CycleDetector] = None,
 ) -> Iterator[str]:
     """Iterate over each tick of the Game.
 
     Yields a string representation the state of the Game after each tick. The
     first frame yielded is the initial state of the game.
 
+    If `metrics` is given, each tick and draw is measured with it. If
+    `cycles` is given, iteration stops after the first frame that repeats an
+    earlier one.
+
     See the `run` method for argument details.
     """
-    yield draw(grid, sep)
+    if cycles is not None:
+        cycles.check(grid)
+    yield draw(grid, sep, stats)
     while turns:
-        grid.tick()
-        yield draw(grid, sep)
+        if metrics is not None:
+            tick_stats = metrics.tick(grid)
+            with metrics.time_render(tick_stats):
+                frame = draw(grid, sep, stats)
+            metrics.record(tick_stats)
+        else:
+            grid.tick()
+            frame = draw(grid, sep, stats)
+        yield frame
+        if cycles is not None and cycles.check(grid):
+            break
         turns -= 1
 
 
-def render(grid: BaseGrid, sep: str = DEFAULT_SEP, out: IO = DEFAULT_OUTFILE):
+def render(
+    grid: BaseGrid,
+    sep: str = DEFAULT_SEP,
+    out: IO = DEFAULT_OUTFILE,
+    stats: bool = False,
+):
     """Print the `grid` to `out` prefixed with the given `sep`."""
-    print(draw(grid, sep), file=out)
+    print(draw(grid, sep, stats), file=out)
+
 
+def draw(grid: BaseGrid, sep: str = DEFAULT_SEP, stats: bool = False) -> str:
+    """Draw the `grid` prefixed with the given `sep`.
 
-def draw(grid: BaseGrid, sep: str = DEFAULT_SEP) -> str:
-    """Draw the `grid` prefixed with the given `sep`."""
+    If `stats` is true, the `status` of the grid is added on a final line.
+    """
+    if stats:
+        return f"{sep}\n{grid}\n{status(grid)}"
     return f"{sep}\n{grid}"
+
+
+def status(grid: BaseGrid) -> str:
+    """Describe the population and bounds of the live cells in `grid`.
+
+    Both are kept up to date by the grid, so this doesn't scan its cells.
+    """
+    bounds = grid.bounds
+    if bounds is None:
+        return f"population: {grid.population}, bounds: none"
+    return (
+        f"population: {grid.population}, bounds: ({bounds.min_x},"
+        f" {bounds.min_y})-({bounds.max_x}, {bounds.max_y})"
+    )
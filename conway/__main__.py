@@ -4,10 +4,12 @@ import sys
 import time
 from itertools import cycle
 from pathlib import Path
-from typing import IO
+from typing import IO, Optional
 
 import conway
-from conway.grid.cell_set import Grid
+from conway.cycles import DEFAULT_MAX_PERIOD, CycleDetector
+from conway.grid import GRID_TYPES, load_grid_cls
+from conway.metrics import Metrics, json_lines_writer
 
 SAMPLE_DIR = Path(__file__).parent.parent.absolute() / "sample_patterns"
 SAMPLE_CHOICES = ("beacon", "blinker", "glider", "toad")
@@ -36,6 +38,13 @@ def main():
             " cell will be living (default: %(const)s)"
         ),
     )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="random seed for {r}, to make the grid reproducible".format(
+            r=fmt_arg(arg_random)
+        ),
+    )
     arg_sample = source_group.add_argument(
         "--sample",
         type=str,
@@ -64,13 +73,21 @@ def main():
         ),
     )
 
+    parser.add_argument(
+        "-e",
+        "--engine",
+        choices=sorted(GRID_TYPES),
+        default="cell_set",
+        help="grid implementation to use (default: %(default)s)",
+    )
+
     arg_width = parser.add_argument(
         "-w", "--width", type=int, help="the width of the grid"
     )
     arg_height = parser.add_argument(
         "-h", "--height", type=int, help="the height of the grid"
     )
-    parser.add_argument(
+    arg_turns = parser.add_argument(
         "-t",
         "--turns",
         type=int,
@@ -101,8 +118,78 @@ def main():
         default=conway.DEFAULT_OUTFILE,
         help="output destination (default: %(default)s)",
     )
+    parser.add_argument(
+        "-m",
+        "--metrics",
+        type=argparse.FileType("w"),
+        metavar="FILE",
+        help=(
+            "write per-turn metrics (timings, cells evaluated, births,"
+            " deaths, population) to %(metavar)s as JSON lines"
+        ),
+    )
+    draw_group = parser.add_mutually_exclusive_group()
+    arg_no_render = draw_group.add_argument(
+        "--no-render",
+        action="store_true",
+        help="don't draw the grid at all; just report how fast it ran",
+    )
+    arg_every = draw_group.add_argument(
+        "--every",
+        type=int,
+        metavar="K",
+        help="only draw every %(metavar)s-th turn, without delay",
+    )
+    arg_final_only = draw_group.add_argument(
+        "--final-only",
+        action="store_true",
+        help="only draw the grid after the last turn, without delay",
+    )
+    # Only turns drawn in full by `conway.run` can be redrawn as a diff.
+    draw_group.add_argument(
+        "--diff",
+        action="store_true",
+        help=(
+            "redraw only the cells that changed each turn, using ANSI escape"
+            " codes, instead of printing the whole grid"
+        ),
+    )
+    arg_stop_on_cycle = parser.add_argument(
+        "--stop-on-cycle",
+        type=int,
+        nargs="?",
+        const=DEFAULT_MAX_PERIOD,
+        metavar="PERIOD",
+        help=(
+            "stop once the grid dies out, settles or starts repeating itself,"
+            " with a period of up to %(metavar)s turns (default: %(const)s)"
+        ),
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="print the population and bounds of the grid after each turn",
+    )
     args = parser.parse_args()
 
+    unbounded = args.turns < 0 and args.stop_on_cycle is None
+    if (args.no_render or args.final_only) and unbounded:
+        parser.error(
+            "{t} or {c} is required to use {n} or {f}".format(
+                t=fmt_arg(arg_turns),
+                c=fmt_arg(arg_stop_on_cycle),
+                n=fmt_arg(arg_no_render),
+                f=fmt_arg(arg_final_only),
+            )
+        )
+    if args.every is not None and args.every < 1:
+        parser.error(f"{fmt_arg(arg_every)} must be a positive integer")
+
+    try:
+        Grid = load_grid_cls(args.engine)
+    except ImportError as exc:
+        parser.error(f"cannot use the {args.engine} engine: {exc}")
+
     # Randomly generate the grid.
     if args.random is not None:
         if not (args.width and args.height):
@@ -114,7 +201,7 @@ def main():
                 )
             )
         grid = Grid(args.width, args.height)
-        grid.randomize(k=args.random)
+        grid.randomize(k=args.random, seed=args.seed)
 
     # Load a sample pattern.
     elif args.sample:
@@ -131,6 +218,37 @@ def main():
     # Expand separator to a full line.
     args.separator *= grid.width // len(args.separator)
 
+    cycles = None
+    if args.stop_on_cycle is not None:
+        cycles = CycleDetector(max_period=args.stop_on_cycle)
+
+    metrics = None
+    if args.metrics:
+        metrics = Metrics(callbacks=[json_lines_writer(args.metrics)])
+
+    # Run it as fast as possible, drawing few or no turns.
+    if args.no_render or args.final_only or args.every:
+        generations, elapsed = conway.fast_forward(
+            grid,
+            turns=args.turns,
+            every=args.every or 0,
+            sep=args.separator,
+            out=args.outfile,
+            metrics=metrics,
+            stats=args.stats,
+            cycles=cycles,
+        )
+        if args.final_only:
+            conway.render(grid, args.separator, args.outfile, args.stats)
+        rate = generations / elapsed if elapsed else float("inf")
+        print(
+            f"{generations} generations in {elapsed:.3f}s"
+            f" ({rate:.1f} generations/s)",
+            file=sys.stderr,
+        )
+        report_cycle(cycles)
+        return
+
     # Run it!
     conway.run(
         grid,
@@ -138,7 +256,17 @@ def main():
         sep=args.separator,
         turns=args.turns,
         out=args.outfile,
+        metrics=metrics,
+        stats=args.stats,
+        diff=args.diff,
+        cycles=cycles,
     )
+    report_cycle(cycles)
+
+
+def report_cycle(cycles: Optional[CycleDetector]):
+    if cycles is not None and cycles.cycle is not None:
+        print(f"stopped: found a {cycles.cycle}", file=sys.stderr)
 
 
 def fmt_arg(arg: argparse.Action):
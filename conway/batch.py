@@ -0,0 +1,211 @@
+"""Run many independent random Games in parallel and summarize each one.
+
+Every run is described by a small `Job` and reduced to a small `Summary`
+in the worker process, so only those tuples cross process boundaries,
+never a Grid.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Sequence
+
+import conway
+from conway.cycles import DEFAULT_MAX_PERIOD, CycleDetector
+from conway.grid import GRID_TYPES, load_grid_cls
+
+DEFAULT_ENGINE = "bitboard"
+DEFAULT_MAX_TURNS = 10000
+
+# How many chunks of jobs to aim for per worker. More, smaller chunks
+# balance uneven runs better; fewer, bigger chunks cost less to send.
+CHUNKS_PER_WORKER = 4
+
+
+class Job(NamedTuple):
+    """One random Game to run."""
+
+    seed: int
+    size: int
+    density: float
+    engine: str = DEFAULT_ENGINE
+    max_turns: int = DEFAULT_MAX_TURNS
+    max_period: int = DEFAULT_MAX_PERIOD
+
+
+class Summary(NamedTuple):
+    """The outcome of a `Job`.
+
+    `generations` is how many generations were run: up to the first one
+    that repeated an earlier one if the Game stabilized, or `max_turns`
+    otherwise. `cycle_start` and `cycle_period` are None if it didn't
+    stabilize.
+    """
+
+    seed: int
+    size: int
+    density: float
+    initial_population: int
+    final_population: int
+    generations: int
+    cycle_start: Optional[int]
+    cycle_period: Optional[int]
+
+
+def mk_jobs(
+    seeds: Iterable[int],
+    sizes: Iterable[int],
+    densities: Iterable[float],
+    **kwargs,
+) -> List[Job]:
+    """Return a Job for every combination of seed, size and density.
+
+    Any other keyword arguments are passed to each `Job`.
+    """
+    return [
+        Job(seed, size, density, **kwargs)
+        for size, density, seed in itertools.product(sizes, densities, seeds)
+    ]
+
+
+def simulate(job: Job) -> Summary:
+    """Run a single Job until it stabilizes or runs out of turns."""
+    grid = load_grid_cls(job.engine)(job.size, job.size)
+    grid.randomize(k=job.density, seed=job.seed)
+    initial_population = grid.population
+
+    cycles = CycleDetector(max_period=job.max_period)
+    generations, _ = conway.fast_forward(
+        grid, turns=job.max_turns, cycles=cycles
+    )
+    cycle = cycles.cycle
+    return Summary(
+        seed=job.seed,
+        size=job.size,
+        density=job.density,
+        initial_population=initial_population,
+        final_population=grid.population,
+        generations=generations,
+        cycle_start=cycle and cycle.start,
+        cycle_period=cycle and cycle.period,
+    )
+
+
+def run_batch(
+    jobs: Sequence[Job],
+    processes: Optional[int] = None,
+    chunksize: Optional[int] = None,
+) -> Iterator[Summary]:
+    """Run `jobs` across a pool of `processes` worker processes.
+
+    Jobs are sent to the workers `chunksize` at a time (by default, enough
+    to give each worker a few chunks). Summaries are yielded in the same
+    order as `jobs`, as soon as each one is ready.
+    """
+    processes = processes or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, len(jobs) // (processes * CHUNKS_PER_WORKER))
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        yield from executor.map(simulate, jobs, chunksize=chunksize)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="conway-batch",
+        description=(
+            "Run many random grids in parallel, writing a JSON summary of"
+            " each run per line."
+        ),
+    )
+    parser.add_argument(
+        "--seeds",
+        type=int,
+        default=100,
+        metavar="N",
+        help=(
+            "number of random seeds to run per size and density"
+            " (default: %(default)s)"
+        ),
+    )
+    parser.add_argument(
+        "--first-seed",
+        type=int,
+        default=0,
+        metavar="SEED",
+        help="seed of the first run (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-s",
+        "--sizes",
+        nargs="+",
+        type=int,
+        default=(64,),
+        metavar="N",
+        help="widths/heights of the grids (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-k",
+        "--densities",
+        nargs="+",
+        type=float,
+        default=(0.3,),
+        metavar="K",
+        help="densities of the random grids (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-e",
+        "--engine",
+        choices=sorted(GRID_TYPES),
+        default=DEFAULT_ENGINE,
+        help="grid implementation to use (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-t",
+        "--max-turns",
+        type=int,
+        default=DEFAULT_MAX_TURNS,
+        help="most turns to run each grid for (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--max-period",
+        type=int,
+        default=DEFAULT_MAX_PERIOD,
+        help="longest cycle to detect (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-j",
+        "--processes",
+        type=int,
+        help="number of worker processes (default: one per CPU)",
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        help="number of runs to send to a worker at a time",
+    )
+    parser.add_argument(
+        "-o",
+        "--outfile",
+        type=argparse.FileType("w"),
+        default=sys.stdout,
+        help="where to write the results (default: stdout)",
+    )
+    args = parser.parse_args()
+
+    jobs = mk_jobs(
+        range(args.first_seed, args.first_seed + args.seeds),
+        args.sizes,
+        args.densities,
+        engine=args.engine,
+        max_turns=args.max_turns,
+        max_period=args.max_period,
+    )
+    for summary in run_batch(jobs, args.processes, args.chunksize):
+        print(json.dumps(summary._asdict()), file=args.outfile, flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+from collections import defaultdict
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from conway.grid import Bounds, Point
+from conway.grid.bitboard import next_row
+from conway.plane import Plane
+
+BLOCK_BITS = 6
+BLOCK_SIZE = 1 << BLOCK_BITS
+# Masks for a whole row of a block, and for a coordinate within a block.
+BLOCK_MASK = (1 << BLOCK_SIZE) - 1
+COORD_MASK = BLOCK_SIZE - 1
+
+# A block is a list of `BLOCK_SIZE` rows, each packed into an int with bit
+# ``x`` holding the cell at local column ``x``.
+Block = List[int]
+BlockKey = Tuple[int, int]
+
+EMPTY_BLOCK: Block = [0] * BLOCK_SIZE
+
+
+def block_population(block: Block) -> int:
+    """Return the number of live cells in `block`."""
+    return sum(bin(row).count("1") for row in block)
+
+
+class BlockPlane(Plane):
+    """The Game of Life on an unbounded plane, stored as blocks of cells.
+
+    The plane is divided into `BLOCK_SIZE` x `BLOCK_SIZE` blocks, and only
+    blocks with live cells are stored, in a dict keyed by their block
+    coordinates. A block is created when a cell is born in it and dropped
+    as soon as its last cell dies, so memory and the cost of a `tick` follow
+    the live pattern wherever it goes, rather than the area it has covered.
+
+    Within a block, each generation is computed a whole row at a time with
+    the same bitwise logic as ``conway.grid.bitboard``, with each row
+    extended by one cell from the neighboring blocks on either side.
+    """
+
+    def __init__(self):
+        self.blocks: Dict[BlockKey, Block] = {}
+        self.population = 0
+        self.generation = 0
+
+    @classmethod
+    def from_set(cls, set_: Iterable[Point], **kwargs) -> "BlockPlane":
+        """Create a plane from a Set of live Points."""
+        plane = cls(**kwargs)
+        blocks: Dict[BlockKey, Block] = defaultdict(lambda: [0] * BLOCK_SIZE)
+        for x, y in set(set_):
+            block = blocks[x >> BLOCK_BITS, y >> BLOCK_BITS]
+            block[y & COORD_MASK] |= 1 << (x & COORD_MASK)
+            plane.population += 1
+        plane.blocks = dict(blocks)
+        return plane
+
+    def __iter__(self) -> Iterator[Point]:
+        for (bx, by), block in self.blocks.items():
+            x0, y0 = bx << BLOCK_BITS, by << BLOCK_BITS
+            for y, row in enumerate(block):
+                while row:
+                    low = row & -row
+                    yield Point(x0 + low.bit_length() - 1, y0 + y)
+                    row ^= low
+
+    def __len__(self) -> int:
+        return self.population
+
+    def get_cell(self, point: Point) -> bool:
+        key = (point.x >> BLOCK_BITS, point.y >> BLOCK_BITS)
+        block = self.blocks.get(key)
+        if block is None:
+            return False
+        row = block[point.y & COORD_MASK]
+        return bool(row >> (point.x & COORD_MASK) & 1)
+
+    def bounds(self) -> Optional[Bounds]:
+        """Return the smallest rectangle containing every live cell."""
+        min_x = min_y = max_x = max_y = None
+        for (bx, by), block in self.blocks.items():
+            x0, y0 = bx << BLOCK_BITS, by << BLOCK_BITS
+            columns = 0
+            for row in block:
+                columns |= row
+            rows = [y for y, row in enumerate(block) if row]
+            left = x0 + (columns & -columns).bit_length() - 1
+            right = x0 + columns.bit_length() - 1
+            top, bottom = y0 + rows[0], y0 + rows[-1]
+            if min_x is None:
+                min_x, min_y, max_x, max_y = left, top, right, bottom
+            else:
+                min_x, max_x = min(min_x, left), max(max_x, right)
+                min_y, max_y = min(min_y, top), max(max_y, bottom)
+        if min_x is None:
+            return None
+        return Bounds(min_x, min_y, max_x, max_y)
+
+    def active_blocks(self) -> Set[BlockKey]:
+        """Return the keys of every block that might have live cells next
+        generation.
+
+        That's every block with live cells, plus each neighboring block that
+        one of those has a live cell next to.
+        """
+        active = set(self.blocks)
+        last = BLOCK_SIZE - 1
+        for (bx, by), block in self.blocks.items():
+            columns = 0
+            for row in block:
+                columns |= row
+            west, east = columns & 1, columns >> last
+            north, south = block[0], block[last]
+            for dy, edge in ((-1, north), (1, south)):
+                if edge:
+                    active.add((bx, by + dy))
+                    if edge & 1:
+                        active.add((bx - 1, by + dy))
+                    if edge >> last:
+                        active.add((bx + 1, by + dy))
+            if west:
+                active.add((bx - 1, by))
+            if east:
+                active.add((bx + 1, by))
+        return active
+
+    def step_block(self, bx: int, by: int) -> Block:
+        """Return the next generation of the block at (`bx`, `by`)."""
+        blocks, last = self.blocks, BLOCK_SIZE - 1
+
+        def get(dx: int, dy: int) -> Block:
+            return blocks.get((bx + dx, by + dy), EMPTY_BLOCK)
+
+        def extend(west: int, row: int, east: int) -> int:
+            # Bit 0 is the last cell of the western neighbor, and bit
+            # `BLOCK_SIZE + 1` the first cell of the eastern one.
+            return west >> last | row << 1 | (east & 1) << BLOCK_SIZE + 1
+
+        west, centre, east = get(-1, 0), get(0, 0), get(1, 0)
+        rows = [extend(get(-1, -1)[last], get(0, -1)[last], get(1, -1)[last])]
+        rows.extend(map(extend, west, centre, east))
+        rows.append(extend(get(-1, 1)[0], get(0, 1)[0], get(1, 1)[0]))
+
+        block = []
+        for y in range(1, BLOCK_SIZE + 1):
+            north, row, south = rows[y - 1], rows[y], rows[y + 1]
+            neighbors = (
+                north << 1,
+                north,
+                north >> 1,
+                row << 1,
+                row >> 1,
+                south << 1,
+                south,
+                south >> 1,
+            )
+            block.append(next_row(row, neighbors) >> 1 & BLOCK_MASK)
+        return block
+
+    def tick(self):
+        """Advance the plane forward by one step.
+
+        Only `active_blocks` are stepped. Blocks left without any live cells
+        are dropped.
+        """
+        blocks = {}
+        population = 0
+        for key in self.active_blocks():
+            block = self.step_block(*key)
+            if any(block):
+                blocks[key] = block
+                population += block_population(block)
+        self.blocks = blocks
+        self.population = population
+        self.generation += 1
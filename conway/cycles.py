@@ -0,0 +1,64 @@
+from collections import deque
+from typing import Deque, Dict, NamedTuple, Optional, Tuple
+
+from conway.grid import BaseGrid
+
+DEFAULT_MAX_PERIOD = 64
+
+
+class Cycle(NamedTuple):
+    """A repeating sequence of generations.
+
+    `start` is the first generation of the cycle and `period` is the number
+    of generations it takes to repeat. A still life (including an empty
+    grid) has a period of 1.
+    """
+
+    start: int
+    period: int
+
+    def __str__(self):
+        if self.period == 1:
+            return f"still life from generation {self.start}"
+        return f"period {self.period} cycle from generation {self.start}"
+
+
+class CycleDetector:
+    """Notice when a Game starts repeating itself.
+
+    Pass a CycleDetector to ``conway.run`` or ``conway.run_iter`` to stop
+    the Game once it repeats, after which the repetition is kept in `cycle`.
+
+    Each generation is identified by the grid's `fingerprint` and
+    population, rather than a copy of its cells, and only the last
+    `max_period` generations are remembered, so cycles longer than that
+    aren't detected.
+    """
+
+    def __init__(self, max_period: int = DEFAULT_MAX_PERIOD):
+        self.max_period = max_period
+        self.cycle: Optional[Cycle] = None
+        self.generation = 0
+        self._seen: Dict[Tuple[int, int], int] = {}
+        self._history: Deque[Tuple[int, int]] = deque()
+
+    def check(self, grid: BaseGrid) -> Optional[Cycle]:
+        """Record the next generation of `grid`.
+
+        Call this once with the initial grid and then after every tick.
+        Returns the Cycle if this generation repeats a remembered one.
+        """
+        key = (grid.fingerprint, grid.population)
+        generation = self.generation
+        self.generation += 1
+
+        start = self._seen.get(key)
+        if start is not None:
+            self.cycle = Cycle(start, generation - start)
+            return self.cycle
+
+        self._seen[key] = generation
+        self._history.append(key)
+        if len(self._history) > self.max_period:
+            del self._seen[self._history.popleft()]
+        return None
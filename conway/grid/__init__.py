@@ -1,5 +1,6 @@
 import abc
 import copy
+import importlib
 import itertools
 import random
 from collections.abc import Collection
@@ -11,9 +12,11 @@ from typing import (
     Iterable,
     Iterator,
     NamedTuple,
+    Optional,
     Sequence,
     Set,
     Tuple,
+    Type,
     TypeVar,
 )
 
@@ -46,6 +49,134 @@ DIRS = {
 }
 
 
+# Characters used to draw dead and live cells, and a table that translates a
+# buffer of 0 and 1 bytes into them (leaving newlines alone).
+CHAR_DEAD = b"."
+CHAR_ALIVE = b"*"
+FRAME_TABLE = bytes.maketrans(b"\0\1", CHAR_DEAD + CHAR_ALIVE)
+
+
+class Bounds(NamedTuple):
+    """The smallest rectangle containing every live cell in a Grid.
+
+    All four edges are inclusive.
+    """
+
+    min_x: int
+    min_y: int
+    max_x: int
+    max_y: int
+
+    def extend(self, point: Point) -> "Bounds":
+        """Return the bounds grown, if necessary, to contain `point`."""
+        return Bounds(
+            min(self.min_x, point.x),
+            min(self.min_y, point.y),
+            max(self.max_x, point.x),
+            max(self.max_y, point.y),
+        )
+
+    def on_edge(self, point: Point) -> bool:
+        """Return whether `point` lies on one of the edges."""
+        return point.x in (self.min_x, self.max_x) or point.y in (
+            self.min_y,
+            self.max_y,
+        )
+
+
+def random_bytes(count: int, k: float, seed: Optional[int] = None) -> bytes:
+    """Return `count` random 0 and 1 bytes, each 1 with probability `k`.
+
+    The bytes are drawn in bulk from a ``random.Random(seed)``, so the
+    same seed always gives the same bytes. Each is 1 if a random byte is
+    below ``k * 256``, so `k` is rounded to the nearest 1/256.
+    """
+    threshold = round(min(max(k, 0.0), 1.0) * 256)
+    table = bytes(byte < threshold for byte in range(256))
+    rng = random.Random(seed)
+    return (
+        rng.getrandbits(8 * count).to_bytes(count, "little").translate(table)
+    )
+
+
+def measure_points(points: Iterable[Point]) -> Tuple[int, Optional[Bounds]]:
+    """Count the given live cells and find their bounds.
+
+    Returns a (population, bounds) pair, where bounds is None if there are
+    no live cells.
+    """
+    population = 0
+    min_x = min_y = max_x = max_y = 0
+    for x, y in points:
+        if not population:
+            min_x = max_x = x
+            min_y = max_y = y
+        else:
+            if x < min_x:
+                min_x = x
+            elif x > max_x:
+                max_x = x
+            if y < min_y:
+                min_y = y
+            elif y > max_y:
+                max_y = y
+        population += 1
+    if not population:
+        return 0, None
+    return population, Bounds(min_x, min_y, max_x, max_y)
+
+
+def measure_rows(
+    rows: Iterable[Tuple[int, int, int, int]],
+) -> Tuple[int, Optional[Bounds]]:
+    """Count live cells and find their bounds from a summary of each row.
+
+    `rows` holds a (y, population, first x, last x) tuple for each row
+    that has any live cells, from top to bottom. Returns a (population,
+    bounds) pair like `measure_points`.
+    """
+    population = 0
+    min_x = min_y = max_x = max_y = 0
+    for y, count, first, last in rows:
+        if not population:
+            min_x, min_y, max_x = first, y, last
+        else:
+            min_x, max_x = min(min_x, first), max(max_x, last)
+        max_y = y
+        population += count
+    if not population:
+        return 0, None
+    return population, Bounds(min_x, min_y, max_x, max_y)
+
+
+MASK_64 = (1 << 64) - 1
+
+
+def zobrist_key(x: int, y: int) -> int:
+    """Return a pseudo-random 64-bit key for the cell at (`x`, `y`).
+
+    This is the splitmix64 finalizer applied to the packed coordinates, so
+    keys are well mixed but need no table to look them up.
+    """
+    z = ((y & 0xFFFFFFFF) << 32 | x & 0xFFFFFFFF) + 0x9E3779B97F4A7C15
+    z = (z ^ z >> 30) * 0xBF58476D1CE4E5B9 & MASK_64
+    z = (z ^ z >> 27) * 0x94D049BB133111EB & MASK_64
+    return z ^ z >> 31
+
+
+def zobrist(points: Iterable[Point]) -> int:
+    """XOR together the Zobrist keys of the given cells.
+
+    XOR-ing the result with the key of a cell toggles that cell, so a
+    fingerprint of a set of live cells can be updated with just the cells
+    that changed.
+    """
+    fingerprint = 0
+    for x, y in points:
+        fingerprint ^= zobrist_key(x, y)
+    return fingerprint
+
+
 T = TypeVar("T")
 
 
@@ -55,6 +186,24 @@ class BaseGrid(Generic[T], Collection, metaclass=abc.ABCMeta):
     height: int = None  # type: ignore
     cells: T = None  # type: ignore
     swap: Iterator[Tuple[T, T]] = field(init=False)
+    # Number of cells visited by the last call to `tick`.
+    cells_evaluated: int = field(
+        init=False, default=0, repr=False, compare=False
+    )
+    # Population and bounds of the live cells, kept up to date by `tick`
+    # and `__setitem__` (see `population` and `bounds`).
+    _population: int = field(init=False, default=0, repr=False, compare=False)
+    _bounds: Optional[Bounds] = field(
+        init=False, default=None, repr=False, compare=False
+    )
+    _bounds_stale: bool = field(
+        init=False, default=False, repr=False, compare=False
+    )
+    # Zobrist hash of the live cells, once it's been asked for (see
+    # `fingerprint`).
+    _fingerprint: Optional[int] = field(
+        init=False, default=None, repr=False, compare=False
+    )
 
     def __post_init__(self):
         if self.cells is None and not (self.width and self.height):
@@ -91,11 +240,29 @@ class BaseGrid(Generic[T], Collection, metaclass=abc.ABCMeta):
         swap_cells = self.mk_zeroed_cells()
         self.swap = cycle(((self.cells, swap_cells), (swap_cells, self.cells)))
 
+        self.recount()
+
     def __str__(self):
-        return "\n".join(
-            "".join([cell and "*" or "." for _, cell in row])
-            for row in chunks(tuple(self.enumerate_cells()), self.width)
-        )
+        return self.to_bytes().decode("ascii")
+
+    def to_bytes(self) -> bytes:
+        """Draw the Grid as ASCII bytes, one line per row.
+
+        Live cells are drawn as `CHAR_ALIVE` and dead cells as `CHAR_DEAD`.
+        This fills a preallocated frame of dead cells and then marks each
+        live cell; implementations should override it to draw their cells
+        in bulk where they can (e.g. with `FRAME_TABLE`). Cells stored
+        outside the Grid aren't drawn.
+        """
+        width, height = self.width, self.height
+        stride = width + 1
+        frame = bytearray(CHAR_DEAD * width + b"\n") * height
+        alive = CHAR_ALIVE[0]
+        for x, y in self:
+            if 0 <= x < width and 0 <= y < height:
+                frame[y * stride + x] = alive
+        frame.pop()
+        return bytes(frame)
 
     @classmethod
     @abc.abstractmethod
@@ -178,6 +345,96 @@ class BaseGrid(Generic[T], Collection, metaclass=abc.ABCMeta):
         where `x` is the value of the cell at each Point.
         """
 
+    def measure_cells(self) -> Tuple[int, Optional[Bounds]]:
+        """Count the live cells and find their bounds from scratch.
+
+        Returns a (population, bounds) pair like `measure_points`. This
+        scans every cell in the Grid; implementations should override it
+        with something faster where they can.
+        """
+        return measure_points(iter(self))
+
+    def recount(self):
+        """Reset `population` and `bounds` from `measure_cells`."""
+        self._population, self._bounds = self.measure_cells()
+        self._bounds_stale = False
+
+    def update_counts(self, births: Iterable[Point], deaths: Iterable[Point]):
+        """Update `population`, `bounds` and `fingerprint` for cells that
+        changed state.
+
+        Births can only grow the bounds, so they're applied directly. A death
+        on the edge of the bounds might shrink them, so the bounds are
+        marked stale and remeasured the next time they're needed. Cells
+        outside the Grid (which only Grids that don't wrap can store) are
+        never counted.
+        """
+        width, height = self.width, self.height
+        fingerprint = self._fingerprint
+        for point in deaths:
+            if not (0 <= point.x < width and 0 <= point.y < height):
+                continue
+            self._population -= 1
+            if self._bounds and self._bounds.on_edge(point):
+                self._bounds_stale = True
+            if fingerprint is not None:
+                fingerprint ^= zobrist_key(*point)
+        for point in births:
+            if not (0 <= point.x < width and 0 <= point.y < height):
+                continue
+            self._population += 1
+            if self._bounds is None:
+                self._bounds = Bounds(point.x, point.y, point.x, point.y)
+            else:
+                self._bounds = self._bounds.extend(point)
+            if fingerprint is not None:
+                fingerprint ^= zobrist_key(*point)
+        self._fingerprint = fingerprint
+
+    def diff_cells(self, cells: T, next_cells: T) -> Iterator[Point]:
+        """Return an iterator over the Points that differ between two cells
+        collections with the Grid's dimensions.
+
+        This compares every cell; implementations should override it to skip
+        unchanged rows (or other runs of cells) in bulk.
+        """
+        for point, _ in self.enumerate_cells():
+            if self.get_cell(cells, point) != self.get_cell(next_cells, point):
+                yield point
+
+    def update_fingerprint(self, cells: T, next_cells: T):
+        """Update `fingerprint` after a tick from `cells` to `next_cells`.
+
+        Only the cells that changed are hashed, and nothing is done until
+        the fingerprint has been asked for at least once.
+        """
+        if self._fingerprint is not None:
+            self._fingerprint ^= zobrist(self.diff_cells(cells, next_cells))
+
+    @property
+    def population(self) -> int:
+        """The number of live cells in the Grid."""
+        return self._population
+
+    @property
+    def bounds(self) -> Optional[Bounds]:
+        """The smallest rectangle containing every live cell, if any."""
+        if self._bounds_stale:
+            self.recount()
+        return self._bounds
+
+    @property
+    def fingerprint(self) -> int:
+        """A Zobrist hash of the live cells.
+
+        Grids with the same live cells have the same fingerprint. It's
+        computed from scratch the first time it's asked for, then kept up to
+        date by `tick` and `__setitem__` from just the cells that change.
+        """
+        if self._fingerprint is None:
+            self._fingerprint = zobrist(iter(self))
+        return self._fingerprint
+
     def count_live_neighbors(self, point: Point) -> int:
         """Return the number of live neighbors adjacent to the given Point."""
         return sum(self[point + delta] for delta in DIRS)
@@ -190,23 +447,57 @@ class BaseGrid(Generic[T], Collection, metaclass=abc.ABCMeta):
             raise TypeError(f"expected a Point, got {type(item)}")
         return self.__getitem__(item)
 
+    def canonical_point(self, point: Point) -> Point:
+        """Return the Point that a cell at `point` is stored as.
+
+        The Grid wraps around its edges by default, so this wraps `point`
+        into the Grid. Grids that don't wrap return `point` as is.
+        """
+        return Point(point.x % self.width, point.y % self.height)
+
     def __setitem__(self, point: Point, value: bool):
-        return self.set_cell(self.cells, point, value)
+        was_alive = bool(self[point])
+        self.set_cell(self.cells, point, value)
+        if bool(self[point]) != was_alive:
+            point = self.canonical_point(point)
+            if value:
+                self.update_counts((point,), ())
+            else:
+                self.update_counts((), (point,))
 
     def __iter__(self) -> Iterator[Point]:
         return (point for point, cell in self.enumerate_cells() if cell)
 
     def __len__(self) -> int:
-        return len(tuple(iter(self)))
+        return self._population
 
-    def randomize(self, k=0.5):
-        for y in range(self.height):
-            for x in range(self.width):
-                self[Point(x, y)] = random.random() < k
+    def randomize(self, k: float = 0.5, seed: Optional[int] = None):
+        """Replace every cell with a random one, alive with probability `k`.
+
+        If `seed` is given, the same seed always gives the same cells, on
+        every kind of Grid. See `random_bytes` for details.
+        """
+        self.load_bytes(random_bytes(self.width * self.height, k, seed))
+        self.recount()
+        self._fingerprint = None
+
+    def load_bytes(self, data: bytes):
+        """Overwrite every cell from `data`, one 0 or 1 byte per cell.
+
+        `data` holds the rows of the Grid from top to bottom. The cells are
+        updated in place, since `swap` holds on to them. This sets each cell
+        in turn; implementations should override it to copy whole rows (or
+        the whole buffer) where they can. It doesn't update `population`,
+        `bounds` or `fingerprint`.
+        """
+        width = self.width
+        for index, cell in enumerate(data):
+            y, x = divmod(index, width)
+            self.set_cell(self.cells, Point(x, y), bool(cell))
 
     def tick(self):
         """Advance the Grid forward by one step.
-        
+
         Generates a new generation of cells by applying the Game of Life
         rules to each cell simultaneously, then updates the Grid with the
         result.
@@ -228,6 +519,31 @@ class BaseGrid(Generic[T], Collection, metaclass=abc.ABCMeta):
                 self.set_cell(next_cells, point, self[point])
 
         self.cells = next_cells
+        self.cells_evaluated = self.width * self.height
+        self.recount()
+        self.update_fingerprint(cells, next_cells)
+
+
+"""Grid implementations by name, mapped to the module that defines them.
+
+The modules are only imported when a Grid is loaded with `load_grid_cls`, so
+optional dependencies (like NumPy) aren't needed unless they're used.
+"""
+GRID_TYPES = {
+    "bitboard": "conway.grid.bitboard",
+    "cell_set": "conway.grid.cell_set",
+    "flat": "conway.grid.flat",
+    "int_set": "conway.grid.int_set",
+    "lookup": "conway.grid.lookup",
+    "ndarray": "conway.grid.ndarray",
+    "tiled": "conway.grid.tiled",
+    "toroidal": "conway.grid.toroidal",
+}
+
+
+def load_grid_cls(name: str) -> Type[BaseGrid]:
+    """Import and return the Grid class registered as `name`."""
+    return importlib.import_module(GRID_TYPES[name]).Grid  # type: ignore
 
 
 def chunks(seq: Sequence, chunk_size: int) -> Iterator[Sequence]:
@@ -0,0 +1,231 @@
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from conway.grid import (
+    CHAR_ALIVE,
+    CHAR_DEAD,
+    BaseGrid,
+    Bounds,
+    Point,
+    measure_rows,
+)
+
+# Translates the binary digits of a packed row into cells.
+BIT_TABLE = bytes.maketrans(b"01", CHAR_DEAD + CHAR_ALIVE)
+# Translates cells (0 and 1 bytes) into binary digits.
+DIGIT_TABLE = bytes.maketrans(b"\0\1", b"01")
+# Translates drawn cells into binary digits; the inverse of `BIT_TABLE`.
+CHAR_TABLE = bytes.maketrans(CHAR_DEAD + CHAR_ALIVE, b"01")
+
+
+class BitRows(list):
+    """A list of rows, each packed into a single ``int`` bitboard.
+
+    Bit ``x`` of row ``y`` holds the cell at ``Point(x, y)``, so a row takes
+    one bit per cell no matter how wide the grid is. The ``width`` of the
+    rows is kept alongside them since it can't be derived from the ints.
+    """
+
+    def __init__(self, rows: Iterable[int] = (), width: int = 0):
+        super().__init__(rows)
+        self.width = width
+
+
+def pack_row(row: Iterable[Any]) -> int:
+    """Pack a sequence of cells into an int, one bit per cell."""
+    return sum(1 << x for x, cell in enumerate(row) if cell)
+
+
+def rows_to_bytes(rows: Iterable[int], width: int) -> bytes:
+    """Draw packed rows as ASCII bytes, one line per row.
+
+    Each row is formatted as binary digits, reversed so the lowest bit (the
+    leftmost cell) comes first, and the digits are translated into cells.
+    """
+    fmt = f"0{width}b"
+    return (
+        "\n".join(format(row, fmt)[::-1] for row in rows)
+        .encode("ascii")
+        .translate(BIT_TABLE)
+    )
+
+
+def bytes_to_rows(data: bytes) -> List[int]:
+    """Pack the rows of a grid drawn as ASCII bytes, one line per row.
+
+    This is the inverse of `rows_to_bytes`, and works on the output of
+    ``BaseGrid.to_bytes`` too.
+    """
+    return [
+        int(line[::-1], 2) for line in data.translate(CHAR_TABLE).split(b"\n")
+    ]
+
+
+def row_size(width: int) -> int:
+    """Return the number of bytes needed to pack a row of `width` cells."""
+    return (width + 7) // 8
+
+
+def next_row(row: int, neighbors: Iterable[int]) -> int:
+    """Return the next generation of a packed `row`.
+
+    `neighbors` are the eight packed rows holding, at each bit position, the
+    neighbor in one direction of the cell at that position in `row`. They
+    are summed column-wise with bitwise adder logic into a 1s bit, a 2s bit,
+    and a "4 or more" bit, then the Game of Life rules are applied to every
+    cell in the row at once.
+    """
+    ones = twos = fours = 0
+    for neighbor in neighbors:
+        carry = ones & neighbor
+        ones ^= neighbor
+        fours |= twos & carry
+        twos ^= carry
+
+    # A cell is alive if it has 3 live neighbors, or if it is already alive
+    # and has 2 live neighbors.
+    return ~fours & twos & (ones | row)
+
+
+def step_band(
+    rows: Sequence[int], width: int, above: int, below: int
+) -> Iterator[int]:
+    """Yield the next generation of a contiguous band of packed `rows`.
+
+    `above` and `below` are the rows just outside the band. Every row is
+    rotated one bit in each direction to line up each cell with its west
+    and east neighbors, wrapping around at the edges of the row. Only a
+    window of three rotated rows is kept at a time.
+    """
+    mask = (1 << width) - 1
+    shift = width - 1
+
+    def rotated(row: int) -> Tuple[int, int, int]:
+        return (
+            ((row << 1) & mask) | (row >> shift),
+            row,
+            (row >> 1) | ((row & 1) << shift),
+        )
+
+    last = len(rows) - 1
+    north, centre = rotated(above), rotated(rows[0])
+    for y in range(len(rows)):
+        south = rotated(rows[y + 1] if y < last else below)
+        yield next_row(centre[1], (*north, centre[0], centre[2], *south))
+        north, centre = centre, south
+
+
+class Grid(BaseGrid[BitRows]):
+    """A toroidal Grid storing each row as an arbitrary-precision int.
+
+    Each generation is computed a whole row at a time with bitwise logic on
+    the row above, the row itself, and the row below. The edges of the grid
+    wrap around like ``conway.grid.toroidal.Grid``: horizontal wrapping is
+    done by rotating the bits of each row.
+    """
+
+    def __post_init__(self):
+        super().__post_init__()
+
+        # Pad grid with dead rows to reach `self.height`.
+        padding = max(0, self.height - len(self.cells))
+        self.cells.extend(0 for _ in range(padding))
+        self.cells.width = self.width
+
+    @classmethod
+    def from_2d_seq(cls, seq: Sequence[Sequence[Any]], **kwargs) -> "Grid":
+        width = kwargs.pop("width", None) or max(len(row) for row in seq)
+        cells = BitRows((pack_row(row) for row in seq), width=width)
+        return Grid(width, cells=cells, **kwargs)
+
+    @classmethod
+    def from_set(cls, set_: Set[Point], **kwargs) -> "Grid":
+        width = kwargs.get("width") or max(x for x, _ in set_) + 1
+        height = kwargs.get("height") or max(y for _, y in set_) + 1
+        cells = BitRows([0] * height, width=width)
+        for point in set_:
+            cls.set_cell(cells, point, True)
+        return Grid(width, height, cells=cells)
+
+    def mk_zeroed_cells(self) -> BitRows:
+        return BitRows([0] * self.height, width=self.width)
+
+    def calculate_size(self) -> Tuple[int, int]:
+        width = self.cells.width or max(row.bit_length() for row in self.cells)
+        height = len(self.cells)
+        return width, height
+
+    @classmethod
+    def get_cell(cls, cells: BitRows, point: Point) -> bool:
+        row = cells[point.y % len(cells)]
+        return bool(row >> (point.x % cells.width) & 1)
+
+    @classmethod
+    def set_cell(cls, cells: BitRows, point: Point, value: bool):
+        y = point.y % len(cells)
+        bit = 1 << (point.x % cells.width)
+        if value:
+            cells[y] |= bit
+        else:
+            cells[y] &= ~bit
+
+    def enumerate_cells(self) -> Iterator[Tuple[Point, bool]]:
+        for y, row in enumerate(self.cells):
+            for x in range(self.width):
+                yield Point(x, y), bool(row >> x & 1)
+
+    def load_bytes(self, data: bytes):
+        # Reverse each row's digits so its first cell is the lowest bit.
+        width = self.width
+        digits = data.translate(DIGIT_TABLE)
+        for y in range(len(self.cells)):
+            row = digits[y * width : (y + 1) * width]
+            self.cells[y] = int(row[::-1], 2)
+
+    def to_bytes(self) -> bytes:
+        return rows_to_bytes(self.cells, self.width)
+
+    def diff_cells(
+        self, cells: BitRows, next_cells: BitRows
+    ) -> Iterator[Point]:
+        for y, (row, next_row) in enumerate(zip(cells, next_cells)):
+            diff = row ^ next_row
+            while diff:
+                low = diff & -diff
+                yield Point(low.bit_length() - 1, y)
+                diff ^= low
+
+    def measure_cells(self) -> Tuple[int, Optional[Bounds]]:
+        return measure_rows(
+            (
+                y,
+                bin(row).count("1"),
+                (row & -row).bit_length() - 1,
+                row.bit_length() - 1,
+            )
+            for y, row in enumerate(self.cells)
+            if row
+        )
+
+    def tick(self):
+        """Advance the Grid forward by one step.
+
+        The whole Grid is stepped as a single band with `step_band`, with
+        the bottom and top rows wrapping around to each other.
+        """
+        cells, next_cells = next(self.swap)
+        band = step_band(cells, self.width, cells[-1], cells[0])
+        for y, row in enumerate(band):
+            next_cells[y] = row
+        self.cells = next_cells
+        self.cells_evaluated = self.width * self.height
+        self.recount()
+        self.update_fingerprint(cells, next_cells)
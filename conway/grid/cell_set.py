@@ -1,15 +1,17 @@
+from collections import Counter
 from typing import (
     Any,
     Iterable,
     Iterator,
     MutableSet,
     NamedTuple,
+    Optional,
     Sequence,
     Set,
     Tuple,
 )
 
-from conway.grid import DIRS, BaseGrid, Point
+from conway.grid import DIRS, BaseGrid, Bounds, Point, measure_points
 
 T = MutableSet[Point]
 
@@ -54,8 +56,73 @@ class Grid(BaseGrid[T]):
         else:
             cells.discard(point)
 
+    def canonical_point(self, point: Point) -> Point:
+        # The Grid doesn't wrap, so cells are stored where they're set.
+        return point
+
+    def __iter__(self) -> Iterator[Point]:
+        # Cells set outside the Grid are stored, but aren't part of it.
+        width, height = self.width, self.height
+        return (
+            point
+            for point in self.cells
+            if 0 <= point.x < width and 0 <= point.y < height
+        )
+
+    def load_bytes(self, data: bytes):
+        cells, width = self.cells, self.width
+        cells.clear()
+        index = data.find(1)
+        while index != -1:
+            y, x = divmod(index, width)
+            cells.add(Point(x, y))
+            index = data.find(1, index + 1)
+
+    def measure_cells(self) -> Tuple[int, Optional[Bounds]]:
+        return measure_points(iter(self))
+
     def enumerate_cells(self) -> Iterator[Tuple[Point, bool]]:
         for y in range(self.height):
             for x in range(self.width):
                 point = Point(x, y)
                 yield point, self[point]
+
+    def tick(self):
+        """Advance the Grid forward by one step.
+
+        Only live cells and their neighbors can change state, so rather than
+        visiting every cell in the Grid this counts, for each live cell, a
+        hit on each of its in-bounds neighbors. The cost of a step is
+        proportional to the population instead of the area of the Grid.
+
+        Births and deaths are applied to `cells` in place, so the set is
+        never rebuilt or cleared and its storage is reused from one
+        generation to the next.
+        """
+        cells = self.cells
+        width, height = self.width, self.height
+        live_neighbors = Counter(
+            Point(x + dx, y + dy)
+            for x, y in cells
+            for dx, dy in DIRS
+            if 0 <= x + dx < width and 0 <= y + dy < height
+        )
+
+        # A cell is alive if it has 3 live neighbors, or if it is already
+        # alive and has 2 live neighbors.
+        deaths = [
+            point for point in cells if live_neighbors[point] not in (2, 3)
+        ]
+        births = [
+            point
+            for point, count in live_neighbors.items()
+            if count == 3 and point not in cells
+        ]
+
+        # Every live cell and every cell with a live neighbor was visited,
+        # counting each cell once.
+        self.cells_evaluated = len(live_neighbors.keys() | cells)
+
+        cells.difference_update(deaths)
+        cells.update(births)
+        self.update_counts(births, deaths)
@@ -0,0 +1,226 @@
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from conway.grid import (
+    DIRS,
+    FRAME_TABLE,
+    BaseGrid,
+    Bounds,
+    Point,
+    measure_rows,
+)
+
+# Next state of a cell, indexed by its current state then its live neighbors.
+NEXT_STATE = (
+    bytes([0, 0, 0, 1, 0, 0, 0, 0, 0]),
+    bytes([0, 0, 1, 1, 0, 0, 0, 0, 0]),
+)
+
+NeighborTable = List[Tuple[Tuple[int, ...], List[range]]]
+
+
+class FlatCells(bytearray):
+    """A 2-D array of cells stored row after row in a single ``bytearray``.
+
+    The cell at ``Point(x, y)`` is at index ``y * width + x``. Each cell is
+    a 0 or a 1.
+    """
+
+    def __init__(
+        self, data: Iterable[int] = b"", width: int = 0, height: int = 0
+    ):
+        super().__init__(data)
+        self.width = width
+        self.height = height
+
+
+def edge_spans(size: int) -> List[Tuple[int, int]]:
+    """Split the coordinates [0, `size`) into first, middle, and last.
+
+    Returns a (start, stop) pair for each non-empty span.
+    """
+    if size == 1:
+        return [(0, 1)]
+    spans = [(0, 1), (1, size - 1), (size - 1, size)]
+    return [(start, stop) for start, stop in spans if start < stop]
+
+
+def mk_neighbor_table(width: int, height: int) -> NeighborTable:
+    """Group the cells of a toroidal grid by the offsets of their neighbors.
+
+    Cells are grouped into up to nine edge classes (corners, edges, and the
+    interior). Every cell in a class finds its eight neighbors at the same
+    offsets from its own index, with wrapping already worked out. Returns
+    an (offsets, ranges of indices) pair for each class, with offsets in
+    the order of ``sorted(DIRS)``.
+    """
+    table = []
+    for x0, x1 in edge_spans(width):
+        for y0, y1 in edge_spans(height):
+            # Work out the offsets once, from the first cell in the class.
+            index = y0 * width + x0
+            offsets = tuple(
+                (y0 + dy) % height * width + (x0 + dx) % width - index
+                for dx, dy in sorted(DIRS)
+            )
+            spans = [
+                range(y * width + x0, y * width + x1) for y in range(y0, y1)
+            ]
+            table.append((offsets, spans))
+    return table
+
+
+class Grid(BaseGrid[FlatCells]):
+    """A toroidal Grid stored in a single flat ``bytearray``.
+
+    Wrapping around the edges of the grid is resolved once, when the Grid
+    is created, by building a table of neighbor offsets for each edge class
+    of cells (see `mk_neighbor_table`). Stepping then only adds offsets to
+    flat indices, without any modulo arithmetic or nested indexing.
+    """
+
+    def __post_init__(self):
+        # If the Grid is bigger than its `cells`, lay them out again at the
+        # Grid's size before the swap buffer is made to match.
+        cells = self.cells
+        if cells is not None:
+            width = self.width or cells.width
+            height = self.height or cells.height
+            if width >= cells.width and height >= cells.height:
+                self.cells = resize(cells, width, height)
+
+        super().__post_init__()
+
+        self.neighbor_table = mk_neighbor_table(self.width, self.height)
+
+    @classmethod
+    def from_2d_seq(cls, seq: Sequence[Sequence[Any]], **kwargs) -> "Grid":
+        width = kwargs.pop("width", None) or max(len(row) for row in seq)
+        height = kwargs.pop("height", None) or len(seq)
+        cells = FlatCells(bytes(width * height), width, height)
+        for y, row in enumerate(seq):
+            cells[y * width : y * width + len(row)] = bytes(
+                bool(cell) for cell in row
+            )
+        return cls(width, height, cells=cells, **kwargs)
+
+    @classmethod
+    def from_set(cls, set_: Set[Point], **kwargs) -> "Grid":
+        width = kwargs.pop("width", None) or max(x for x, _ in set_) + 1
+        height = kwargs.pop("height", None) or max(y for _, y in set_) + 1
+        cells = FlatCells(bytes(width * height), width, height)
+        for x, y in set_:
+            cells[y * width + x] = 1
+        return cls(width, height, cells=cells, **kwargs)
+
+    def mk_zeroed_cells(self) -> FlatCells:
+        return FlatCells(
+            bytes(self.width * self.height), self.width, self.height
+        )
+
+    def calculate_size(self) -> Tuple[int, int]:
+        return self.cells.width, self.cells.height
+
+    @classmethod
+    def get_cell(cls, cells: FlatCells, point: Point) -> bool:
+        x, y = point.x % cells.width, point.y % cells.height
+        return bool(cells[y * cells.width + x])
+
+    @classmethod
+    def set_cell(cls, cells: FlatCells, point: Point, value: bool):
+        x, y = point.x % cells.width, point.y % cells.height
+        cells[y * cells.width + x] = bool(value)
+
+    def enumerate_cells(self) -> Iterator[Tuple[Point, bool]]:
+        width = self.width
+        for index, cell in enumerate(self.cells):
+            y, x = divmod(index, width)
+            yield Point(x, y), bool(cell)
+
+    def load_bytes(self, data: bytes):
+        self.cells[:] = data
+
+    def to_bytes(self) -> bytes:
+        cells = memoryview(self.cells)
+        width = self.width
+        return b"\n".join(
+            cells[start : start + width]
+            for start in range(0, len(cells), width)
+        ).translate(FRAME_TABLE)
+
+    def diff_cells(
+        self, cells: FlatCells, next_cells: FlatCells
+    ) -> Iterator[Point]:
+        width = self.width
+        for y, start in enumerate(range(0, len(cells), width)):
+            stop = start + width
+            if cells[start:stop] != next_cells[start:stop]:
+                for x in range(width):
+                    if cells[start + x] != next_cells[start + x]:
+                        yield Point(x, y)
+
+    def measure_cells(self) -> Tuple[int, Optional[Bounds]]:
+        cells, width = self.cells, self.width
+        return measure_rows(
+            (
+                y,
+                cells.count(1, start, start + width),
+                cells.find(1, start, start + width) - start,
+                cells.rfind(1, start, start + width) - start,
+            )
+            for y, start in enumerate(range(0, len(cells), width))
+            if cells.find(1, start, start + width) != -1
+        )
+
+    def tick(self):
+        """Advance the Grid forward by one step.
+
+        Each edge class is stepped in turn, with its eight neighbor offsets
+        unpacked into locals for the inner loop.
+        """
+        cells, next_cells = next(self.swap)
+        dead, alive = NEXT_STATE
+
+        for offsets, spans in self.neighbor_table:
+            nw, w, sw, n, s, ne, e, se = offsets
+            for span in spans:
+                for i in span:
+                    live_neighbors = (
+                        cells[i + nw]
+                        + cells[i + w]
+                        + cells[i + sw]
+                        + cells[i + n]
+                        + cells[i + s]
+                        + cells[i + ne]
+                        + cells[i + e]
+                        + cells[i + se]
+                    )
+                    next_cells[i] = (alive if cells[i] else dead)[
+                        live_neighbors
+                    ]
+
+        self.cells = next_cells
+        self.cells_evaluated = self.width * self.height
+        self.recount()
+        self.update_fingerprint(cells, next_cells)
+
+
+def resize(cells: FlatCells, width: int, height: int) -> FlatCells:
+    """Return a copy of `cells` padded with dead cells to `width` x
+    `height`.
+    """
+    if (cells.width, cells.height) == (width, height):
+        return cells
+    resized = FlatCells(bytes(width * height), width, height)
+    for y in range(cells.height):
+        row = cells[y * cells.width : (y + 1) * cells.width]
+        resized[y * width : y * width + cells.width] = row
+    return resized
@@ -0,0 +1,158 @@
+from collections import Counter
+from typing import Any, Iterator, Optional, Sequence, Set, Tuple
+
+from conway.grid import DIRS, BaseGrid, Bounds, Point
+
+T = Set[int]
+
+# Each cell is stored as a single int key, with its y coordinate in the
+# high bits and its x coordinate in the low `SHIFT` bits.
+SHIFT = 32
+X_MASK = (1 << SHIFT) - 1
+
+# What to add to a key to get the key of each of its neighbors.
+NEIGHBOR_DELTAS = tuple((dy << SHIFT) + dx for dx, dy in sorted(DIRS))
+
+
+def encode(point: Point) -> int:
+    """Return the key of the cell at `point`.
+
+    Any y is allowed, but x must be in [0, 2 ** `SHIFT`), or the key would
+    belong to a different Point; a ValueError is raised otherwise.
+    """
+    if not 0 <= point.x <= X_MASK:
+        raise ValueError(f"x out of range: {point.x}")
+    return (point.y << SHIFT) + point.x
+
+
+def decode(key: int) -> Point:
+    """Return the Point of the cell with the given key."""
+    return Point(key & X_MASK, key >> SHIFT)
+
+
+class Grid(BaseGrid[T]):
+    """A bounded Grid that stores its live cells as a set of int keys.
+
+    This works like ``conway.grid.cell_set.Grid``, but each live cell is a
+    single int (see `encode`) rather than a ``Point`` tuple. Each key
+    takes about half the memory of a ``Point``, and stepping never builds
+    a ``Point``: finding a neighbor is a single addition of one of
+    `NEIGHBOR_DELTAS`. Points are only built at the edges, e.g. when
+    iterating over the Grid.
+    """
+
+    @classmethod
+    def from_2d_seq(cls, seq: Sequence[Sequence[Any]], **kwargs) -> "Grid":
+        width = kwargs.get("width") or max(len(row) for row in seq)
+        height = kwargs.get("height") or len(seq)
+        cells = {
+            (y << SHIFT) + x
+            for y, row in enumerate(seq)
+            for x, cell in enumerate(row)
+            if cell
+        }
+        return Grid(width, height, cells=cells)
+
+    @classmethod
+    def from_set(cls, set_: Set[Point], **kwargs) -> "Grid":
+        return Grid(cells={encode(point) for point in set_}, **kwargs)
+
+    def mk_zeroed_cells(self) -> T:
+        return set()
+
+    def calculate_size(self) -> Tuple[int, int]:
+        if not self.cells:
+            return 0, 0
+        max_x = max(key & X_MASK for key in self.cells)
+        return max_x + 1, (max(self.cells) >> SHIFT) + 1
+
+    @classmethod
+    def get_cell(cls, cells: T, point: Point) -> bool:
+        # No cell can be stored with an x that `encode` rejects.
+        return 0 <= point.x <= X_MASK and encode(point) in cells
+
+    @classmethod
+    def set_cell(cls, cells: T, point: Point, value: bool):
+        if value:
+            cells.add(encode(point))
+        else:
+            cells.discard(encode(point))
+
+    def canonical_point(self, point: Point) -> Point:
+        # The Grid doesn't wrap, so cells are stored where they're set.
+        return point
+
+    def in_grid(self, key: int) -> bool:
+        """Return whether the cell with the given key is inside the Grid."""
+        return key & X_MASK < self.width and 0 <= key >> SHIFT < self.height
+
+    def __iter__(self) -> Iterator[Point]:
+        # Cells set outside the Grid are stored, but aren't part of it.
+        return map(decode, filter(self.in_grid, self.cells))
+
+    def load_bytes(self, data: bytes):
+        cells, width = self.cells, self.width
+        cells.clear()
+        index = data.find(1)
+        while index != -1:
+            y, x = divmod(index, width)
+            cells.add((y << SHIFT) + x)
+            index = data.find(1, index + 1)
+
+    def measure_cells(self) -> Tuple[int, Optional[Bounds]]:
+        cells = list(filter(self.in_grid, self.cells))
+        if not cells:
+            return 0, None
+        xs = [key & X_MASK for key in cells]
+        return len(cells), Bounds(
+            min(xs), min(cells) >> SHIFT, max(xs), max(cells) >> SHIFT
+        )
+
+    def enumerate_cells(self) -> Iterator[Tuple[Point, bool]]:
+        cells = self.cells
+        for y in range(self.height):
+            for x in range(self.width):
+                yield Point(x, y), (y << SHIFT) + x in cells
+
+    def tick(self):
+        """Advance the Grid forward by one step.
+
+        Like ``cell_set.Grid.tick``, this counts a hit on each neighbor of
+        each live cell. Neighbors are counted a delta at a time, by mapping
+        the delta's ``__add__`` over the set, so the counting loop runs in
+        C. Neighbors that fall off the edges of the Grid are counted too,
+        but like in ``cell_set.Grid.tick``, only cells inside the Grid can
+        be born or survive.
+        """
+        cells = self.cells
+        width, height = self.width, self.height
+        live_neighbors: Counter = Counter()
+        for delta in NEIGHBOR_DELTAS:
+            live_neighbors.update(map(delta.__add__, cells))
+
+        # A cell is alive if it has 3 live neighbors, or if it is already
+        # alive and has 2 live neighbors.
+        count = live_neighbors.get
+        deaths = [
+            key
+            for key in cells
+            if count(key) not in (2, 3)
+            or key & X_MASK >= width
+            or not 0 <= key >> SHIFT < height
+        ]
+        births = [
+            key
+            for key, n in live_neighbors.items()
+            if n == 3
+            and key not in cells
+            and key & X_MASK < width
+            and 0 <= key >> SHIFT < height
+        ]
+
+        # Every live cell and every cell with a live neighbor was visited,
+        # counting each cell once.
+        self.cells_evaluated = len(live_neighbors.keys() | cells)
+
+        cells.difference_update(deaths)
+        cells.update(births)
+        self.update_counts(map(decode, births), map(decode, deaths))
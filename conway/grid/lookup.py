@@ -0,0 +1,160 @@
+from typing import Any, Iterator, List, Optional, Sequence, Set, Tuple
+
+from conway.grid import FRAME_TABLE, BaseGrid, Bounds, Point, measure_rows
+
+T = List[bytearray]
+
+
+def mk_rule_table() -> bytes:
+    """Return the next state of a cell for every 3x3 neighborhood.
+
+    The table is indexed by a 9-bit neighborhood made up of three 3-bit
+    columns, west to east, each holding the cells above, at, and below the
+    row being stepped, top to bottom::
+
+        bit:  8 5 2
+              7 4 1
+              6 3 0
+
+    so the cell being stepped is bit 4.
+    """
+    table = bytearray(512)
+    for index in range(512):
+        cell = index >> 4 & 1
+        live_neighbors = bin(index).count("1") - cell
+        table[index] = live_neighbors == 3 or (live_neighbors == 2 and cell)
+    return bytes(table)
+
+
+RULE_TABLE = mk_rule_table()
+
+
+def column_codes(above: bytes, row: bytes, below: bytes) -> bytes:
+    """Pack each column of three rows of cells into a 3-bit code.
+
+    Every cell is 0 or 1, so the rows can be combined as big ints without
+    any carries between bytes.
+    """
+    return (
+        int.from_bytes(above, "big") << 2
+        | int.from_bytes(row, "big") << 1
+        | int.from_bytes(below, "big")
+    ).to_bytes(len(row), "big")
+
+
+class Grid(BaseGrid[T]):
+    """A toroidal Grid stepped by looking up each 3x3 neighborhood.
+
+    Each row is stored as a ``bytearray`` of 0s and 1s. To step a row, the
+    three rows around it are packed into 3-bit column codes, and each cell's
+    next state is read from `RULE_TABLE` using the codes of its own column
+    and the columns on either side, so no neighbors are counted one by one.
+    Like ``conway.grid.toroidal.Grid``, the edges of the grid wrap around.
+    """
+
+    def __post_init__(self):
+        super().__post_init__()
+
+        # Pad grid with dead rows to reach `self.height`.
+        padding = max(0, self.height - len(self.cells))
+        self.cells.extend(bytearray(self.width) for _ in range(padding))
+
+        # Pad short rows with dead cells to reach `self.width`.
+        for row in self.cells:
+            row.extend(bytes(max(0, self.width - len(row))))
+
+    @classmethod
+    def from_2d_seq(cls, seq: Sequence[Sequence[Any]], **kwargs) -> "Grid":
+        cells = [bytearray(bool(cell) for cell in row) for row in seq]
+        return cls(cells=cells, **kwargs)
+
+    @classmethod
+    def from_set(cls, set_: Set[Point], **kwargs) -> "Grid":
+        width = kwargs.pop("width", None) or max(x for x, _ in set_) + 1
+        height = kwargs.pop("height", None) or max(y for _, y in set_) + 1
+        cells = [bytearray(width) for _ in range(height)]
+        for x, y in set_:
+            cells[y][x] = 1
+        return cls(width, height, cells=cells, **kwargs)
+
+    def mk_zeroed_cells(self) -> T:
+        return [bytearray(self.width) for _ in range(self.height)]
+
+    def calculate_size(self) -> Tuple[int, int]:
+        width = max(len(row) for row in self.cells)
+        height = len(self.cells)
+        return width, height
+
+    @classmethod
+    def get_cell(cls, cells: T, point: Point) -> bool:
+        row = cells[point.y % len(cells)]
+        return bool(row[point.x % len(row)])
+
+    @classmethod
+    def set_cell(cls, cells: T, point: Point, value: bool):
+        row = cells[point.y % len(cells)]
+        row[point.x % len(row)] = bool(value)
+
+    def enumerate_cells(self) -> Iterator[Tuple[Point, bool]]:
+        for y, row in enumerate(self.cells):
+            for x, cell in enumerate(row):
+                yield Point(x, y), bool(cell)
+
+    def load_bytes(self, data: bytes):
+        width = self.width
+        for y, row in enumerate(self.cells):
+            row[:] = data[y * width : (y + 1) * width]
+
+    def to_bytes(self) -> bytes:
+        return b"\n".join(self.cells).translate(FRAME_TABLE)
+
+    def diff_cells(self, cells: T, next_cells: T) -> Iterator[Point]:
+        for y, (row, next_row) in enumerate(zip(cells, next_cells)):
+            if row != next_row:
+                for x, (cell, next_cell) in enumerate(zip(row, next_row)):
+                    if cell != next_cell:
+                        yield Point(x, y)
+
+    def measure_cells(self) -> Tuple[int, Optional[Bounds]]:
+        return measure_rows(
+            (y, row.count(1), row.find(1), row.rfind(1))
+            for y, row in enumerate(self.cells)
+            if 1 in row
+        )
+
+    def tick(self):
+        """Advance the Grid forward by one step."""
+        cells, next_cells = next(self.swap)
+        height = self.height
+        for y in range(height):
+            # Index -1 wraps to the bottom row on its own.
+            self.step_row(
+                cells[y - 1], cells[y], cells[(y + 1) % height], next_cells[y]
+            )
+        self.cells = next_cells
+        self.cells_evaluated = self.width * self.height
+        self.recount()
+        self.update_fingerprint(cells, next_cells)
+
+    @staticmethod
+    def step_row(
+        above: bytearray, row: bytearray, below: bytearray, out: bytearray
+    ):
+        """Write the next generation of `row` to `out`.
+
+        Each cell's neighborhood index is the code of the column to its west
+        shifted onto the code of its own column, then the code of the column
+        to its east. The first two are combined for the whole row at once
+        since, at 6 bits, they still fit in a byte.
+        """
+        codes = column_codes(above, row, below)
+        east = codes[1:] + codes[:1]
+        west_and_centre = (
+            int.from_bytes(codes[-1:] + codes[:-1], "big") << 3
+            | int.from_bytes(codes, "big")
+        ).to_bytes(len(codes), "big")
+
+        table = RULE_TABLE
+        out[:] = bytes(
+            [table[wc << 3 | e] for wc, e in zip(west_and_centre, east)]
+        )
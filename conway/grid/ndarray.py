@@ -0,0 +1,308 @@
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from conway.grid import (
+    CHAR_ALIVE,
+    CHAR_DEAD,
+    BaseGrid,
+    Bounds,
+    Point,
+    random_bytes,
+)
+
+T = np.ndarray
+
+# Row/column offsets of the eight neighbors of a cell.
+NEIGHBOR_SHIFTS = tuple(
+    (dy, dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if (dy, dx) != (0, 0)
+)
+
+
+@dataclass
+class Grid(BaseGrid[T]):
+    """A toroidal Grid backed by a 2-D NumPy array.
+
+    Cells are stored as a ``(height, width)`` array of ``bool``, and each
+    generation is computed for the whole array at once by summing shifted
+    views of a padded copy of it, so stepping never goes through
+    ``count_live_neighbors``.
+    Like ``conway.grid.toroidal.Grid``, the edges of the grid wrap around.
+    """
+
+    buffers: Optional[Tuple[T, T, T, T, Tuple[T, ...]]] = field(
+        init=False, default=None, repr=False, compare=False
+    )
+
+    @classmethod
+    def from_2d_seq(cls, seq: Sequence[Sequence[Any]], **kwargs) -> "Grid":
+        width = kwargs.get("width") or max(len(row) for row in seq)
+        height = kwargs.get("height") or len(seq)
+        cells = np.zeros((height, width), dtype=bool)
+        for y, row in enumerate(seq):
+            cells[y, : len(row)] = [bool(cell) for cell in row]
+        return Grid(width, height, cells=cells)
+
+    @classmethod
+    def from_set(cls, set_: Set[Point], **kwargs) -> "Grid":
+        width = kwargs.get("width") or max(x for x, _ in set_) + 1
+        height = kwargs.get("height") or max(y for _, y in set_) + 1
+        cells = np.zeros((height, width), dtype=bool)
+        for x, y in set_:
+            cells[y, x] = True
+        return Grid(width, height, cells=cells)
+
+    def mk_zeroed_cells(self) -> T:
+        return np.zeros((self.height, self.width), dtype=bool)
+
+    def calculate_size(self) -> Tuple[int, int]:
+        height, width = self.cells.shape
+        return width, height
+
+    @classmethod
+    def get_cell(cls, cells: T, point: Point) -> bool:
+        height, width = cells.shape
+        return bool(cells[point.y % height, point.x % width])
+
+    @classmethod
+    def set_cell(cls, cells: T, point: Point, value: bool):
+        height, width = cells.shape
+        cells[point.y % height, point.x % width] = value
+
+    def enumerate_cells(self) -> Iterator[Tuple[Point, bool]]:
+        for y, row in enumerate(self.cells.tolist()):
+            for x, cell in enumerate(row):
+                yield Point(x, y), cell
+
+    def load_bytes(self, data: bytes):
+        cells = np.frombuffer(data, dtype=np.uint8)
+        np.copyto(
+            self.cells, cells.reshape(self.cells.shape), casting="unsafe"
+        )
+
+    def to_bytes(self) -> bytes:
+        height, width = self.cells.shape
+        frame = np.full((height, width + 1), ord("\n"), dtype=np.uint8)
+        frame[:, :width] = np.where(self.cells, CHAR_ALIVE[0], CHAR_DEAD[0])
+        return frame.tobytes()[:-1]
+
+    def diff_cells(self, cells: T, next_cells: T) -> Iterator[Point]:
+        ys, xs = np.nonzero(cells != next_cells)
+        return (Point(x, y) for x, y in zip(xs.tolist(), ys.tolist()))
+
+    def measure_cells(self) -> Tuple[int, Optional[Bounds]]:
+        population = int(np.count_nonzero(self.cells))
+        if not population:
+            return 0, None
+        ys = np.flatnonzero(self.cells.any(axis=1))
+        xs = np.flatnonzero(self.cells.any(axis=0))
+        return population, Bounds(
+            int(xs[0]), int(ys[0]), int(xs[-1]), int(ys[-1])
+        )
+
+    def tick(self):
+        """Advance the Grid forward by one step.
+
+        The cells are copied into the centre of a padded buffer with each
+        edge wrapped around to the opposite side, then the live neighbors of
+        every cell are counted at once by summing the eight views of the
+        buffer offset in each direction. All of the buffers and views are
+        made once, in `mk_buffers`, and reused every generation.
+        """
+        if self.buffers is None:
+            self.buffers = self.mk_buffers()
+        padded, centre, neighbors, counted, offsets = self.buffers
+        cells, next_cells = next(self.swap)
+
+        # Copy the cells in, then wrap the rows and then the columns.
+        np.copyto(centre, cells)
+        padded[0, 1:-1] = cells[-1]
+        padded[-1, 1:-1] = cells[0]
+        padded[:, 0] = padded[:, -2]
+        padded[:, -1] = padded[:, 1]
+
+        next_generation(cells, offsets, neighbors, counted, out=next_cells)
+        self.cells = next_cells
+        self.cells_evaluated = self.width * self.height
+        self.recount()
+        self.update_fingerprint(cells, next_cells)
+
+    def mk_buffers(self) -> Tuple[T, T, T, T, Tuple[T, ...]]:
+        """Make the scratch buffers used by `tick`.
+
+        Returns the padded buffer, its centre, the neighbor counts, a
+        scratch array of flags, and the eight offset views of the padded
+        buffer.
+        """
+        height, width = self.height, self.width
+        padded = np.zeros((height + 2, width + 2), dtype=np.uint8)
+        return (
+            padded,
+            padded[1:-1, 1:-1],
+            np.zeros((height, width), dtype=np.uint8),
+            np.zeros((height, width), dtype=bool),
+            offset_views(padded),
+        )
+
+
+def offset_views(padded: T) -> Tuple[T, ...]:
+    """Return the eight views of `padded` offset towards each neighbor.
+
+    `padded` holds one or more grids with a border one cell wide around
+    each, in its last two axes. Each view is the size of the grids inside
+    the border, so adding them all up counts the live neighbors of every
+    cell.
+    """
+    height, width = padded.shape[-2] - 2, padded.shape[-1] - 2
+    return tuple(
+        padded[..., 1 + dy : 1 + dy + height, 1 + dx : 1 + dx + width]
+        for dy, dx in NEIGHBOR_SHIFTS
+    )
+
+
+def next_generation(
+    cells: T,
+    offsets: Tuple[T, ...],
+    neighbors: Optional[T] = None,
+    counted: Optional[T] = None,
+    out: Optional[T] = None,
+) -> T:
+    """Return the generation after `cells`, given the `offset_views` of a
+    padded copy of them.
+
+    `neighbors` (of ``uint8``), `counted` and `out` (of ``bool``) are
+    scratch arrays the same shape as `cells`, made if not given, so that
+    callers stepping many times can reuse them.
+    """
+    if neighbors is None:
+        neighbors = np.empty(cells.shape, dtype=np.uint8)
+    if counted is None:
+        counted = np.empty(cells.shape, dtype=bool)
+    if out is None:
+        out = np.empty(cells.shape, dtype=bool)
+
+    np.add(offsets[0], offsets[1], out=neighbors)
+    for offset in offsets[2:]:
+        np.add(neighbors, offset, out=neighbors)
+
+    # A cell is alive if it has 3 live neighbors, or if it is already
+    # alive and has 2 live neighbors.
+    np.equal(neighbors, 2, out=counted)
+    np.logical_and(counted, cells, out=counted)
+    np.equal(neighbors, 3, out=out)
+    np.logical_or(out, counted, out=out)
+    return out
+
+
+def step(cells: T) -> T:
+    """Return the next generation of one or more toroidal grids.
+
+    `cells` is an array of ``bool`` whose last two axes are the height and
+    width of each grid; any leading axes (e.g. a batch of grids) are
+    stepped independently.
+    """
+    pad_width = [(0, 0)] * (cells.ndim - 2) + [(1, 1), (1, 1)]
+    padded = np.pad(cells.astype(np.uint8), pad_width, mode="wrap")
+    return next_generation(cells, offset_views(padded))
+
+
+class GridStack:
+    """Many same-sized toroidal grids, stepped together as one array.
+
+    Cells are stored as a ``(count, height, width)`` array of ``bool``, so a
+    single `tick` advances every grid with a handful of vectorized
+    operations, rather than one Python-level `Grid.tick` per grid.
+
+    A grid that stops changing (a still life), or returns to the state it
+    had two generations ago (a period 2 oscillator), is marked inactive and
+    isn't stepped again; its cycle is recorded in `cycle_starts` and
+    `periods`, in the same terms as ``conway.cycles.Cycle``.
+    """
+
+    def __init__(self, cells: Any):
+        self.cells = np.array(cells, dtype=bool)
+        if self.cells.ndim != 3 or 0 in self.cells.shape:
+            raise ValueError(
+                "`cells` must be a non-empty (count, height, width) array"
+            )
+        count = len(self.cells)
+        self.previous = np.zeros_like(self.cells)
+        self.active = np.ones(count, dtype=bool)
+        self.cycle_starts = np.full(count, -1, dtype=np.int64)
+        self.periods = np.zeros(count, dtype=np.int64)
+        self.generation = 0
+
+    @classmethod
+    def from_grids(cls, grids: Sequence[BaseGrid]) -> "GridStack":
+        """Stack the live cells of `grids`, which must all be the same
+        size."""
+        if len({(grid.width, grid.height) for grid in grids}) != 1:
+            raise ValueError("`grids` must be non-empty and the same size")
+        cells = np.zeros(
+            (len(grids), grids[0].height, grids[0].width), dtype=bool
+        )
+        for index, grid in enumerate(grids):
+            for x, y in grid:
+                cells[index, y, x] = True
+        return cls(cells)
+
+    @classmethod
+    def random(
+        cls,
+        count: int,
+        width: int,
+        height: int,
+        k: float = 0.5,
+        seed: Optional[int] = None,
+    ) -> "GridStack":
+        """Make `count` random grids where each cell is alive with
+        probability `k`.
+
+        If `seed` is given, grid ``i`` has the same cells as any Grid of the
+        same size after ``randomize(k, seed + i)``.
+        """
+        size = width * height
+        data = b"".join(
+            random_bytes(size, k, None if seed is None else seed + index)
+            for index in range(count)
+        )
+        cells = np.frombuffer(data, dtype=np.uint8)
+        return cls(cells.reshape(count, height, width))
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __getitem__(self, index: int) -> Grid:
+        """Return a copy of the grid at `index` as a standalone Grid."""
+        return Grid(cells=self.cells[index])
+
+    def populations(self) -> T:
+        """Return the number of live cells in each grid."""
+        return np.count_nonzero(self.cells, axis=(1, 2))
+
+    def tick(self):
+        """Advance every active grid forward by one step."""
+        self.generation += 1
+        index = np.flatnonzero(self.active)
+        if not len(index):
+            return
+
+        # Step a compact copy of just the active grids.
+        cells = self.cells[index]
+        next_cells = step(cells)
+
+        still = ~(next_cells != cells).any(axis=(1, 2))
+        periods = np.where(still, 1, 0)
+        if self.generation >= 2:
+            repeated = ~(next_cells != self.previous[index]).any(axis=(1, 2))
+            periods[repeated & ~still] = 2
+
+        self.previous[index] = cells
+        self.cells[index] = next_cells
+
+        done = periods > 0
+        stable = index[done]
+        self.active[stable] = False
+        self.periods[stable] = periods[done]
+        self.cycle_starts[stable] = self.generation - periods[done]
@@ -14,7 +14,15 @@ from typing import (
     Union,
 )
 
-from conway.grid import DIRS, BaseGrid, Cell, Point
+from conway.grid import (
+    DIRS,
+    FRAME_TABLE,
+    BaseGrid,
+    Bounds,
+    Cell,
+    Point,
+    measure_rows,
+)
 
 
 class CompositeIterable(Iterable):
@@ -201,3 +209,77 @@ class Grid(BaseGrid[ToroidalArray]):
         for y, row in enumerate(self.cells):
             for x, cell in enumerate(row):
                 yield Point(x, y), cell
+
+    def load_bytes(self, data: bytes):
+        width = self.width
+        for y, row in enumerate(self.cells):
+            row._list[:] = map(bool, data[y * width : (y + 1) * width])
+
+    def to_bytes(self) -> bytes:
+        # Cells are bools, which `bytes` packs as 0 and 1.
+        return b"\n".join(bytes(row._list) for row in self.cells).translate(
+            FRAME_TABLE
+        )
+
+    def diff_cells(
+        self, cells: ToroidalArray, next_cells: ToroidalArray
+    ) -> Iterator[Point]:
+        for y, (row, next_row) in enumerate(zip(cells, next_cells)):
+            row, next_row = row._list, next_row._list
+            if row != next_row:
+                for x, (cell, next_cell) in enumerate(zip(row, next_row)):
+                    if cell != next_cell:
+                        yield Point(x, y)
+
+    def measure_cells(self) -> Tuple[int, Optional[Bounds]]:
+        rows = (row._list for row in self.cells)
+        return measure_rows(
+            (
+                y,
+                cells.count(True),
+                cells.index(True),
+                len(cells) - 1 - cells[::-1].index(True),
+            )
+            for y, cells in enumerate(rows)
+            if True in cells
+        )
+
+    def tick(self):
+        """Advance the Grid forward by one step.
+
+        Works directly on the lists underneath each row's ToroidalArray,
+        with the wrapped column to either side of each cell looked up in a
+        table, so no Points are created and nothing is allocated per cell.
+        """
+        cells, next_cells = next(self.swap)
+        width, height = self.width, self.height
+        west = [(x - 1) % width for x in range(width)]
+        east = [(x + 1) % width for x in range(width)]
+        rows = [row._list for row in cells]
+        next_rows = [row._list for row in next_cells]
+
+        for y, next_row in enumerate(next_rows):
+            # Index -1 wraps to the bottom row on its own.
+            above, row, below = rows[y - 1], rows[y], rows[(y + 1) % height]
+            for x in range(width):
+                w, e = west[x], east[x]
+                live_neighbors = (
+                    above[w]
+                    + above[x]
+                    + above[e]
+                    + row[w]
+                    + row[e]
+                    + below[w]
+                    + below[x]
+                    + below[e]
+                )
+                # A cell is alive if it has 3 live neighbors, or if it is
+                # already alive and has 2 live neighbors.
+                next_row[x] = live_neighbors == 3 or (
+                    live_neighbors == 2 and row[x]
+                )
+
+        self.cells = next_cells
+        self.cells_evaluated = self.width * self.height
+        self.recount()
+        self.update_fingerprint(cells, next_cells)
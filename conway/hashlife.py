@@ -0,0 +1,318 @@
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from conway.grid import Point
+from conway.plane import Plane
+
+DEFAULT_CACHE_SIZE = 1 << 20
+
+# Smallest level the root node is allowed to have. A level 3 node is 8x8.
+MIN_LEVEL = 3
+
+
+class Node:
+    """A node in a HashLife quadtree.
+
+    A node at `level` k is a square of 2^k x 2^k cells made up of four
+    level k-1 children. Level 0 nodes are single cells. Nodes are immutable
+    and canonical, i.e. there is only ever one node for any given pattern,
+    so they are compared and hashed by identity.
+    """
+
+    __slots__ = ("level", "nw", "ne", "sw", "se", "population")
+
+    def __init__(
+        self,
+        level: int,
+        nw: Optional["Node"] = None,
+        ne: Optional["Node"] = None,
+        sw: Optional["Node"] = None,
+        se: Optional["Node"] = None,
+        population: int = 0,
+    ):
+        self.level = level
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.population = population
+
+    def __repr__(self):
+        return "{}(level={}, population={})".format(
+            self.__class__.__name__, self.level, self.population
+        )
+
+
+ON = Node(0, population=1)
+OFF = Node(0, population=0)
+
+
+class HashLife(Plane):
+    """The Game of Life on an unbounded plane, stepped with HashLife.
+
+    The plane is stored as a quadtree of canonical `Node`s, and the result
+    of advancing each node is memoized, so repetitive patterns can be
+    advanced by 2^k generations at a time with `advance`.
+
+    Args:
+        max_cache_size: Number of nodes and memoized results to hold before
+            the caches are garbage collected. Collection drops every result
+            and every node not reachable from the current pattern.
+    """
+
+    def __init__(self, max_cache_size: int = DEFAULT_CACHE_SIZE):
+        self.max_cache_size = max_cache_size
+        self.generation = 0
+
+        self._nodes: Dict[Tuple[Node, Node, Node, Node], Node] = {}
+        self._results: Dict[Tuple[Node, int], Node] = {}
+        self._empty: List[Node] = [OFF]
+
+        self.root = self.empty(MIN_LEVEL)
+        self.origin = Point(0, 0)
+
+    @classmethod
+    def from_set(cls, set_: Iterable[Point], **kwargs) -> "HashLife":
+        """Create a HashLife plane from a Set of live Points."""
+        life = cls(**kwargs)
+        points = set(set_)
+        if not points:
+            return life
+
+        min_x = min(x for x, _ in points)
+        min_y = min(y for _, y in points)
+        nodes = {(x - min_x, y - min_y): ON for x, y in points}
+
+        # Build the tree bottom-up, grouping each 2x2 block of nodes into a
+        # parent until a single node covers every point.
+        level = 0
+        while level < MIN_LEVEL or len(nodes) > 1:
+            empty = life.empty(level)
+            quads: Dict[Tuple[int, int], Dict[int, Node]] = defaultdict(dict)
+            for (x, y), node in nodes.items():
+                quads[x >> 1, y >> 1][(y & 1) << 1 | (x & 1)] = node
+            nodes = {
+                key: life.join(
+                    quad.get(0, empty),
+                    quad.get(1, empty),
+                    quad.get(2, empty),
+                    quad.get(3, empty),
+                )
+                for key, quad in quads.items()
+            }
+            level += 1
+
+        life.root = nodes[0, 0]
+        life.origin = Point(min_x, min_y)
+        return life
+
+    def __iter__(self) -> Iterator[Point]:
+        stack = [(self.root, self.origin.x, self.origin.y)]
+        while stack:
+            node, x, y = stack.pop()
+            if not node.population:
+                continue
+            if node.level == 0:
+                yield Point(x, y)
+                continue
+            half = 1 << (node.level - 1)
+            stack.append((node.se, x + half, y + half))
+            stack.append((node.sw, x, y + half))
+            stack.append((node.ne, x + half, y))
+            stack.append((node.nw, x, y))
+
+    def __len__(self) -> int:
+        return self.root.population
+
+    def get_cell(self, point: Point) -> bool:
+        node = self.root
+        x, y = point.x - self.origin.x, point.y - self.origin.y
+        if not (0 <= x < 1 << node.level and 0 <= y < 1 << node.level):
+            return False
+        while node.level and node.population:
+            half = 1 << (node.level - 1)
+            if y < half:
+                node = node.nw if x < half else node.ne
+            else:
+                node = node.sw if x < half else node.se
+            x, y = x % half, y % half
+        return bool(node.population)
+
+    def join(self, nw: Node, ne: Node, sw: Node, se: Node) -> Node:
+        """Return the canonical node with the given four children."""
+        key = (nw, ne, sw, se)
+        node = self._nodes.get(key)
+        if node is None:
+            node = self._nodes[key] = Node(
+                nw.level + 1,
+                nw,
+                ne,
+                sw,
+                se,
+                nw.population + ne.population + sw.population + se.population,
+            )
+        return node
+
+    def empty(self, level: int) -> Node:
+        """Return the canonical empty node at the given `level`."""
+        while len(self._empty) <= level:
+            node = self._empty[-1]
+            self._empty.append(self.join(node, node, node, node))
+        return self._empty[level]
+
+    def centre(self, node: Node) -> Node:
+        """Return a node one level up with `node` at its centre."""
+        empty = self.empty(node.level - 1)
+        return self.join(
+            self.join(empty, empty, empty, node.nw),
+            self.join(empty, empty, node.ne, empty),
+            self.join(empty, node.sw, empty, empty),
+            self.join(node.se, empty, empty, empty),
+        )
+
+    def advance(self, n: int = 1):
+        """Advance the plane forward by `n` generations.
+
+        The jump is split into powers of two, and each 2^j generations are
+        computed in a single pass over the tree.
+        """
+        if n < 0:
+            raise ValueError("`n` must not be negative")
+        for j in range(n.bit_length()):
+            if n >> j & 1:
+                self._step(j)
+
+    def _step(self, j: int):
+        """Advance the plane forward by 2^j generations."""
+        # Grow the tree until the pattern fits in the centre half of the
+        # root, so nothing can escape the result within 2^j generations.
+        while self.root.level < j + 2 or not self._is_padded(self.root):
+            half = 1 << (self.root.level - 1)
+            self.root = self.centre(self.root)
+            self.origin = Point(self.origin.x - half, self.origin.y - half)
+
+        # The result of a node is its centre, which is exactly the area
+        # covered by the root before it was centred, so the origin is kept.
+        self.root = self.result(self.centre(self.root), j)
+        self.generation += 1 << j
+
+        if len(self._nodes) + len(self._results) > self.max_cache_size:
+            self.collect()
+
+    @staticmethod
+    def _is_padded(node: Node) -> bool:
+        """Return whether all of `node`'s cells lie in its centre half."""
+        return node.population == (
+            node.nw.se.population
+            + node.ne.sw.population
+            + node.sw.ne.population
+            + node.se.nw.population
+        )
+
+    def result(self, node: Node, j: int) -> Node:
+        """Return the centre of `node` advanced by 2^j generations.
+
+        `node` must be at least level 2 and `j` at most ``node.level - 2``.
+        The returned node is one level below `node`.
+        """
+        if not node.population:
+            return node.nw
+
+        key = (node, j)
+        result = self._results.get(key)
+        if result is not None:
+            return result
+
+        if node.level == 2:
+            result = self._life_4x4(node)
+        else:
+            result = self._result(node, j)
+
+        self._results[key] = result
+        return result
+
+    def _result(self, node: Node, j: int) -> Node:
+        nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+        join = self.join
+
+        # Split the node into 9 overlapping sub-squares, one level down.
+        squares = (
+            nw,
+            join(nw.ne, ne.nw, nw.se, ne.sw),
+            ne,
+            join(nw.sw, nw.se, sw.nw, sw.ne),
+            join(nw.se, ne.sw, sw.ne, se.nw),
+            join(ne.sw, ne.se, se.nw, se.ne),
+            sw,
+            join(sw.ne, se.nw, sw.se, se.sw),
+            se,
+        )
+
+        if j < node.level - 2:
+            # Advance each sub-square by the full 2^j generations, then
+            # stitch the centres of the results back together.
+            r = [self.result(square, j) for square in squares]
+            return join(
+                join(r[0].se, r[1].sw, r[3].ne, r[4].nw),
+                join(r[1].se, r[2].sw, r[4].ne, r[5].nw),
+                join(r[3].se, r[4].sw, r[6].ne, r[7].nw),
+                join(r[4].se, r[5].sw, r[7].ne, r[8].nw),
+            )
+
+        # Advance each sub-square halfway, then combine overlapping groups
+        # of four results and advance those the rest of the way.
+        r = [self.result(square, j - 1) for square in squares]
+        return join(
+            self.result(join(r[0], r[1], r[3], r[4]), j - 1),
+            self.result(join(r[1], r[2], r[4], r[5]), j - 1),
+            self.result(join(r[3], r[4], r[6], r[7]), j - 1),
+            self.result(join(r[4], r[5], r[7], r[8]), j - 1),
+        )
+
+    def _life_4x4(self, node: Node) -> Node:
+        """Advance the centre 2x2 cells of a level 2 node by 1 generation."""
+        cells = [[0] * 4 for _ in range(4)]
+        for qx, qy, quad in (
+            (0, 0, node.nw),
+            (2, 0, node.ne),
+            (0, 2, node.sw),
+            (2, 2, node.se),
+        ):
+            cells[qy][qx] = quad.nw.population
+            cells[qy][qx + 1] = quad.ne.population
+            cells[qy + 1][qx] = quad.sw.population
+            cells[qy + 1][qx + 1] = quad.se.population
+
+        def next_cell(x: int, y: int) -> Node:
+            live_neighbors = (
+                sum(cells[y - 1][x - 1 : x + 2])
+                + cells[y][x - 1]
+                + cells[y][x + 1]
+                + sum(cells[y + 1][x - 1 : x + 2])
+            )
+            if live_neighbors == 3 or (live_neighbors == 2 and cells[y][x]):
+                return ON
+            return OFF
+
+        return self.join(
+            next_cell(1, 1), next_cell(2, 1), next_cell(1, 2), next_cell(2, 2)
+        )
+
+    def collect(self):
+        """Garbage collect the node and result caches.
+
+        Every memoized result is dropped, along with every node that isn't
+        part of the current pattern or one of the canonical empty nodes.
+        """
+        self._results.clear()
+
+        nodes: Dict[Tuple[Node, Node, Node, Node], Node] = {}
+        stack = [self.root, *self._empty[1:]]
+        while stack:
+            node = stack.pop()
+            key = (node.nw, node.ne, node.sw, node.se)
+            if node.level == 0 or key in nodes:
+                continue
+            nodes[key] = node
+            stack.extend(key)
+        self._nodes = nodes
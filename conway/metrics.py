@@ -0,0 +1,109 @@
+import json
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import IO, Callable, Deque, Iterable, Iterator, Optional
+
+from conway.grid import BaseGrid
+
+
+@dataclass
+class TickStats:
+    """Measurements of a single generation of the Game."""
+
+    generation: int
+    tick_time: float
+    render_time: float = 0.0
+    cells_evaluated: int = 0
+    births: int = 0
+    deaths: int = 0
+    population: int = 0
+
+
+Callback = Callable[[TickStats], None]
+
+
+class Metrics:
+    """Opt-in instrumentation for a run of the Game.
+
+    Pass a Metrics object to ``conway.run`` or ``conway.run_iter`` to time
+    each tick separately from drawing the grid, and to count the cells each
+    tick evaluated and the cells that were born and died. Each generation's
+    `TickStats` is kept in `history` and passed to every callback.
+
+    Args:
+        callbacks: Functions called with the `TickStats` of each generation
+            once it has been ticked and rendered.
+        history: Number of generations to keep in `history` (default: all).
+        track_changes: Whether to count births and deaths. This compares
+            the live cells before and after each tick, which costs about as
+            much as iterating over the grid twice, but is not included in
+            `tick_time`. Population is always counted, since the grid keeps
+            track of it.
+    """
+
+    def __init__(
+        self,
+        callbacks: Iterable[Callback] = (),
+        history: Optional[int] = None,
+        track_changes: bool = True,
+    ):
+        self.callbacks = list(callbacks)
+        self.history: Deque[TickStats] = deque(maxlen=history)
+        self.track_changes = track_changes
+        self.generation = 0
+
+    def tick(self, grid: BaseGrid) -> TickStats:
+        """Advance `grid` by one step and measure it.
+
+        The returned stats aren't recorded until they're passed to
+        `record`, so that render time can be added to them first.
+        """
+        before = set(grid) if self.track_changes else None
+
+        start = time.perf_counter()
+        grid.tick()
+        tick_time = time.perf_counter() - start
+
+        self.generation += 1
+        stats = TickStats(
+            generation=self.generation,
+            tick_time=tick_time,
+            cells_evaluated=grid.cells_evaluated,
+            population=grid.population,
+        )
+
+        if before is not None:
+            after = set(grid)
+            stats.births = len(after - before)
+            stats.deaths = len(before - after)
+
+        return stats
+
+    @contextmanager
+    def time_render(self, stats: TickStats) -> Iterator[None]:
+        """Add the time spent in the ``with`` block to `stats.render_time`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            stats.render_time += time.perf_counter() - start
+
+    def record(self, stats: TickStats):
+        """Add `stats` to the history and pass them to every callback."""
+        self.history.append(stats)
+        for callback in self.callbacks:
+            callback(stats)
+
+
+def json_lines_writer(out: IO) -> Callback:
+    """Return a callback that writes each generation's stats to `out`.
+
+    Stats are written as one JSON object per line.
+    """
+
+    def write(stats: TickStats):
+        print(json.dumps(asdict(stats)), file=out, flush=True)
+
+    return write
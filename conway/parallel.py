@@ -0,0 +1,178 @@
+import multiprocessing
+import os
+from multiprocessing.shared_memory import SharedMemory
+from typing import Iterator, List, Optional, Tuple, Type
+
+from conway.grid import BaseGrid, Point
+from conway.grid.bitboard import (
+    BitRows,
+    bytes_to_rows,
+    row_size,
+    rows_to_bytes,
+    step_band,
+)
+
+# Shared memory buffers and grid dimensions, set in each worker process by
+# `_init_worker`.
+_worker_buffers: List[SharedMemory] = []
+_worker_size: Tuple[int, int, int] = (0, 0, 0)
+
+
+def _init_worker(names: Tuple[str, str], width: int, height: int):
+    global _worker_buffers, _worker_size
+    _worker_buffers = [SharedMemory(name) for name in names]
+    _worker_size = (width, height, row_size(width))
+
+
+def _step_band(args: Tuple[int, int, int]):
+    """Advance rows [`start`, `stop`) of buffer `src` into the other buffer.
+
+    The rows just above and below the band (the halo) are read from the
+    source buffer, where the neighboring bands wrote them last generation.
+    """
+    src, start, stop = args
+    width, height, stride = _worker_size
+    cells = _worker_buffers[src].buf
+    next_cells = _worker_buffers[1 - src].buf
+
+    rows = [read_row(cells, y, stride) for y in range(start, stop)]
+    above = read_row(cells, (start - 1) % height, stride)
+    below = read_row(cells, stop % height, stride)
+
+    for y, row in enumerate(step_band(rows, width, above, below), start):
+        write_row(next_cells, y, stride, row)
+
+
+def read_row(buf: memoryview, y: int, stride: int) -> int:
+    return int.from_bytes(buf[y * stride : (y + 1) * stride], "little")
+
+
+def write_row(buf: memoryview, y: int, stride: int, row: int):
+    buf[y * stride : (y + 1) * stride] = row.to_bytes(stride, "little")
+
+
+class ParallelGrid:
+    """A toroidal grid stepped in horizontal bands by a pool of processes.
+
+    Cells are bit-packed one row after another into a pair of shared memory
+    buffers: each generation, every worker reads its band (plus the rows on
+    either side of it) from one buffer and writes the next generation of the
+    band to the other, then the buffers swap roles. The result is identical
+    to stepping a ``conway.grid.toroidal.Grid``.
+
+    The worker pool and shared memory must be released with `close`, or by
+    using the grid as a context manager.
+
+    Args:
+        width: The width of the grid.
+        height: The height of the grid.
+        processes: Number of worker processes (default: the CPU count).
+        bands: Number of bands to split the grid into (default: one per
+            worker process).
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        processes: Optional[int] = None,
+        bands: Optional[int] = None,
+    ):
+        if not (width > 0 and height > 0):
+            raise ValueError("`width` and `height` must be greater than zero")
+
+        self.width = width
+        self.height = height
+        self.generation = 0
+
+        self._stride = row_size(width)
+        self._buffers = [
+            SharedMemory(create=True, size=height * self._stride)
+            for _ in range(2)
+        ]
+        self._src = 0
+
+        processes = processes or os.cpu_count() or 1
+        bands = min(bands or processes, height)
+        bounds = [height * i // bands for i in range(bands + 1)]
+        self._bands = list(zip(bounds, bounds[1:]))
+
+        self._pool = multiprocessing.Pool(
+            processes,
+            initializer=_init_worker,
+            initargs=(
+                tuple(buffer.name for buffer in self._buffers),
+                width,
+                height,
+            ),
+        )
+
+    @classmethod
+    def from_grid(cls, grid: BaseGrid, **kwargs) -> "ParallelGrid":
+        """Create a ParallelGrid with the same size and cells as `grid`.
+
+        The rows are packed in bulk from ``grid.to_bytes()``, or taken as
+        they are from a bitboard grid.
+        """
+        if isinstance(grid.cells, BitRows):
+            rows = list(grid.cells)
+        else:
+            rows = bytes_to_rows(grid.to_bytes())
+
+        parallel = cls(grid.width, grid.height, **kwargs)
+        buf = parallel._buffers[parallel._src].buf
+        for y, row in enumerate(rows):
+            write_row(buf, y, parallel._stride, row)
+        return parallel
+
+    def to_grid(self, grid_cls: Type[BaseGrid], **kwargs) -> BaseGrid:
+        """Create a Grid of type `grid_cls` with the current cells."""
+        return grid_cls.from_set(
+            set(self), width=self.width, height=self.height, **kwargs
+        )
+
+    def __enter__(self) -> "ParallelGrid":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __iter__(self) -> Iterator[Point]:
+        buf = self._buffers[self._src].buf
+        for y in range(self.height):
+            row = read_row(buf, y, self._stride)
+            for x in range(self.width):
+                if row >> x & 1:
+                    yield Point(x, y)
+
+    def __len__(self) -> int:
+        buf = self._buffers[self._src].buf
+        cells = int.from_bytes(buf[: self.height * self._stride], "little")
+        return bin(cells).count("1")
+
+    def __str__(self):
+        buf = self._buffers[self._src].buf
+        rows = (read_row(buf, y, self._stride) for y in range(self.height))
+        return rows_to_bytes(rows, self.width).decode("ascii")
+
+    def tick(self, n: int = 1):
+        """Advance the grid forward by `n` steps.
+
+        Each step is a barrier: every band must be written before the
+        buffers are swapped and the next step begins.
+        """
+        for _ in range(n):
+            self._pool.map(
+                _step_band,
+                [(self._src, start, stop) for start, stop in self._bands],
+            )
+            self._src = 1 - self._src
+            self.generation += 1
+
+    def close(self):
+        """Shut down the worker pool and free the shared memory."""
+        self._pool.close()
+        self._pool.join()
+        for buffer in self._buffers:
+            buffer.close()
+            buffer.unlink()
@@ -0,0 +1,51 @@
+import abc
+from typing import Iterable, Iterator, Type
+
+from conway.grid import BaseGrid, Point
+
+
+class Plane(abc.ABC):
+    """Base class for the Game of Life on an unbounded plane.
+
+    Unlike the `BaseGrid` implementations, a plane has no edges: cells
+    never wrap around and nothing is lost off the side. Use `from_grid`
+    and `to_grid` to convert to and from a `BaseGrid`.
+    """
+
+    @classmethod
+    @abc.abstractmethod
+    def from_set(cls, set_: Iterable[Point], **kwargs) -> "Plane":
+        """Create a plane from a Set of live Points."""
+
+    @classmethod
+    def from_grid(cls, grid: BaseGrid, **kwargs) -> "Plane":
+        """Create a plane from the live cells of a Grid."""
+        return cls.from_set(grid, **kwargs)
+
+    def to_grid(
+        self, grid_cls: Type[BaseGrid], width: int, height: int, **kwargs
+    ) -> BaseGrid:
+        """Create a `width` x `height` Grid of type `grid_cls`.
+
+        The Grid's top-left corner is at (0, 0) on the plane. Live cells
+        outside of the Grid are discarded.
+        """
+        cells = {
+            point
+            for point in self
+            if 0 <= point.x < width and 0 <= point.y < height
+        }
+        return grid_cls.from_set(cells, width=width, height=height, **kwargs)
+
+    @abc.abstractmethod
+    def get_cell(self, point: Point) -> bool:
+        """Return whether the cell at the given Point is alive."""
+
+    @abc.abstractmethod
+    def __iter__(self) -> Iterator[Point]:
+        """Iterate over the live cells."""
+
+    def __contains__(self, item: object) -> bool:
+        if not isinstance(item, Point):
+            raise TypeError(f"expected a Point, got {type(item)}")
+        return self.get_cell(item)
@@ -0,0 +1,73 @@
+from typing import IO, Iterator, List, Optional, Tuple
+
+from conway.grid import BaseGrid
+
+CSI = "\x1b["
+CLEAR_SCREEN = f"{CSI}2J"
+
+
+def move_to(row: int, col: int) -> str:
+    """Return the escape code that moves the cursor to (`row`, `col`).
+
+    Both are zero-based, unlike the terminal's own coordinates.
+    """
+    return f"{CSI}{row + 1};{col + 1}H"
+
+
+def changed_spans(old: str, new: str) -> Iterator[Tuple[int, int]]:
+    """Yield the (start, stop) of each run of characters that differ.
+
+    `old` and `new` must be the same length.
+    """
+    start = None
+    for col, (a, b) in enumerate(zip(old, new)):
+        if a != b:
+            if start is None:
+                start = col
+        elif start is not None:
+            yield start, col
+            start = None
+    if start is not None:
+        yield start, len(new)
+
+
+class DiffRenderer:
+    """Draw each generation of a Grid in place on an ANSI terminal.
+
+    The first frame clears the screen and draws the whole grid. After that
+    only the cells that changed since the previous frame are redrawn, by
+    moving the cursor to each run of changed cells, so the output per frame
+    is proportional to the activity in the grid rather than its area. Each
+    frame is sent to `out` in a single write.
+    """
+
+    def __init__(self, out: IO):
+        self.out = out
+        self.previous: Optional[List[str]] = None
+
+    def render(self, grid: BaseGrid, status: Optional[str] = None):
+        """Draw `grid`, followed by a `status` line if one is given."""
+        rows = str(grid).splitlines()
+        previous, self.previous = self.previous, rows
+
+        if previous is None or len(previous) != len(rows):
+            parts = [CLEAR_SCREEN, move_to(0, 0), "\n".join(rows)]
+        else:
+            parts = []
+            for y, (old, new) in enumerate(zip(previous, rows)):
+                if old == new:
+                    continue
+                if len(old) != len(new):
+                    parts.extend((move_to(y, 0), new, f"{CSI}K"))
+                    continue
+                for start, stop in changed_spans(old, new):
+                    parts.extend((move_to(y, start), new[start:stop]))
+
+        # Leave the cursor below the grid, clearing any old status line.
+        parts.append(move_to(len(rows), 0) + f"{CSI}K")
+        if status is not None:
+            parts.append(status)
+        parts.append("\n")
+
+        self.out.write("".join(parts))
+        self.out.flush()
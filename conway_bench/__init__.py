@@ -0,0 +1,162 @@
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Type
+
+from conway.grid import BaseGrid, Point
+from conway.grid.cell_set import Grid as CellSetGrid
+
+DEFAULT_SIZES = (64, 256, 1024, 4096)
+DEFAULT_DENSITIES = (0.1, 0.3, 0.5)
+DEFAULT_SEED = 0
+DEFAULT_MIN_TURNS = 3
+DEFAULT_MAX_TIME = 1.0
+
+Result = Dict[str, Any]
+
+
+def timed(func, *args, **kwargs) -> float:
+    """Call `func` with the given arguments and return how long it took."""
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def random_cells(size: int, density: float, seed: int) -> Set[Point]:
+    """Return a reproducible random set of live cells in a square grid."""
+    rng = random.Random(seed)
+    return {
+        Point(x, y)
+        for y in range(size)
+        for x in range(size)
+        if rng.random() < density
+    }
+
+
+def pattern_cells(pattern: str, size: int) -> Set[Point]:
+    """Return the live cells of `pattern` centered in a square grid."""
+    grid = CellSetGrid.from_str(pattern)
+    dx = (size - grid.width) // 2
+    dy = (size - grid.height) // 2
+    return {Point(x + dx, y + dy) for x, y in grid.cells}
+
+
+def cells_to_str(cells: Set[Point], size: int) -> str:
+    """Draw a set of live cells as a pattern string."""
+    return "\n".join(
+        "".join("*" if Point(x, y) in cells else "." for x in range(size))
+        for y in range(size)
+    )
+
+
+def bench_construction(
+    grid_cls: Type[BaseGrid],
+    cells: Set[Point],
+    size: int,
+    density: float,
+    seed: int,
+) -> Result:
+    """Time building a `size` x `size` Grid in each of the supported ways."""
+    pattern = cells_to_str(cells, size)
+
+    def randomize():
+        grid_cls(size, size).randomize(k=density, seed=seed)
+
+    return {
+        "from_str": timed(grid_cls.from_str, pattern),
+        "from_set": timed(grid_cls.from_set, cells, width=size, height=size),
+        "randomize": timed(randomize),
+    }
+
+
+def bench_ticks(
+    grid_cls: Type[BaseGrid],
+    cells: Set[Point],
+    size: int,
+    min_turns: int = DEFAULT_MIN_TURNS,
+    max_time: float = DEFAULT_MAX_TIME,
+) -> Result:
+    """Measure how fast a Grid with the given `cells` advances.
+
+    Ticks at least `min_turns` times, then keeps going until `max_time`
+    seconds have passed. Peak memory is measured separately, over building
+    the Grid and one tick, since tracing slows the ticks down.
+    """
+    tracemalloc.start()
+    try:
+        grid = grid_cls.from_set(cells, width=size, height=size)
+        grid.tick()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    grid = grid_cls.from_set(cells, width=size, height=size)
+    turns = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while turns < min_turns or elapsed < max_time:
+        grid.tick()
+        turns += 1
+        elapsed = time.perf_counter() - start
+
+    return {
+        "turns": turns,
+        "seconds": elapsed,
+        "generations_per_second": turns / elapsed,
+        "peak_memory": peak_memory,
+    }
+
+
+def run_benchmarks(
+    grid_types: Dict[str, Type[BaseGrid]],
+    sizes: Iterable[int] = DEFAULT_SIZES,
+    densities: Iterable[float] = DEFAULT_DENSITIES,
+    patterns: Optional[Dict[str, str]] = None,
+    seed: int = DEFAULT_SEED,
+    min_turns: int = DEFAULT_MIN_TURNS,
+    max_time: float = DEFAULT_MAX_TIME,
+) -> Iterator[Result]:
+    """Benchmark every Grid type across every size and workload.
+
+    Workloads are random soups at each of the given `densities`, plus each
+    of the given `patterns` centered on an otherwise empty grid. Yields one
+    result per (grid type, size, workload).
+    """
+    for size in sizes:
+        workloads = [
+            ("random", density, random_cells(size, density, seed))
+            for density in densities
+        ]
+        for name, pattern in (patterns or {}).items():
+            cells = pattern_cells(pattern, size)
+            workloads.append((name, len(cells) / (size * size), cells))
+
+        for workload, density, cells in workloads:
+            for grid_name, grid_cls in grid_types.items():
+                yield {
+                    "grid": grid_name,
+                    "size": size,
+                    "workload": workload,
+                    "density": density,
+                    "seed": seed,
+                    "construction": bench_construction(
+                        grid_cls, cells, size, density, seed
+                    ),
+                    **bench_ticks(grid_cls, cells, size, min_turns, max_time),
+                }
+
+
+def environment() -> Dict[str, str]:
+    """Describe where the benchmarks ran, so results can be compared."""
+    return {
+        "python": sys.version,
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def report(results: List[Result]) -> Dict[str, Any]:
+    return {"environment": environment(), "results": results}
@@ -0,0 +1,116 @@
+import argparse
+import json
+import sys
+
+import conway_bench
+from conway.__main__ import SAMPLE_CHOICES, SAMPLE_DIR
+from conway.grid import GRID_TYPES, load_grid_cls
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="conway-bench",
+        description="Benchmark each Grid implementation.",
+    )
+    parser.add_argument(
+        "-g",
+        "--grids",
+        nargs="+",
+        choices=sorted(GRID_TYPES),
+        default=sorted(GRID_TYPES),
+        metavar="GRID",
+        help="grid types to benchmark (default: all of them)",
+    )
+    parser.add_argument(
+        "-s",
+        "--sizes",
+        nargs="+",
+        type=int,
+        default=conway_bench.DEFAULT_SIZES,
+        metavar="N",
+        help="widths/heights of the grids (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-k",
+        "--densities",
+        nargs="+",
+        type=float,
+        default=conway_bench.DEFAULT_DENSITIES,
+        metavar="K",
+        help="densities of the random grids (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-p",
+        "--patterns",
+        nargs="*",
+        choices=SAMPLE_CHOICES,
+        default=SAMPLE_CHOICES,
+        metavar="PATTERN",
+        help="sample patterns to benchmark (default: all of them)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=conway_bench.DEFAULT_SEED,
+        help="random seed (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--min-turns",
+        type=int,
+        default=conway_bench.DEFAULT_MIN_TURNS,
+        help="least number of turns to time (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--max-time",
+        type=float,
+        default=conway_bench.DEFAULT_MAX_TIME,
+        help=(
+            "seconds to keep ticking after --min-turns"
+            " (default: %(default)s)"
+        ),
+    )
+    parser.add_argument(
+        "-o",
+        "--outfile",
+        type=argparse.FileType("w"),
+        default=sys.stdout,
+        help="where to write the JSON results (default: stdout)",
+    )
+    args = parser.parse_args()
+
+    # Skip grid types whose dependencies aren't installed.
+    grid_types = {}
+    for name in args.grids:
+        try:
+            grid_types[name] = load_grid_cls(name)
+        except ImportError as exc:
+            print(f"skipping {name}: {exc}", file=sys.stderr)
+
+    patterns = {}
+    for name in args.patterns:
+        with open(SAMPLE_DIR / name) as fd:
+            patterns[name] = fd.read()
+
+    results = []
+    for result in conway_bench.run_benchmarks(
+        grid_types,
+        sizes=args.sizes,
+        densities=args.densities,
+        patterns=patterns,
+        seed=args.seed,
+        min_turns=args.min_turns,
+        max_time=args.max_time,
+    ):
+        print(
+            "{grid} {size}x{size} {workload} (k={density:.3f}):"
+            " {generations_per_second:.2f} gen/s".format(**result),
+            file=sys.stderr,
+        )
+        results.append(result)
+
+    json.dump(conway_bench.report(results), args.outfile, indent=2)
+    args.outfile.write("\n")
+
+
+if __name__ == "__main__":
+    main()
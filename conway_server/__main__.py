@@ -1,12 +1,14 @@
 import asyncio
 import re
+import time
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Awaitable, Dict, Optional, Sequence, Set, Tuple, Union
 
 import websockets
 
-from conway.grid import BaseGrid
+from conway.grid import BaseGrid, Point
 from conway.grid.cell_set import Grid
+from conway_server import frames as binary_frames
 
 """Regex for parsing incoming client messages.
 
@@ -36,45 +38,341 @@ MSG_MISSING_VALUE = MSG_CLIENT_ERR.format("missing value for `{}`")
 MSG_INVALID_VALUE = MSG_CLIENT_ERR.format(
     "invalid value for `{}`: expected {}"
 )
+MSG_STATS = "stats: population={} bounds={}"
+MSG_KEYFRAME = "keyframe {}"
+MSG_DELTA = "delta {}"
 
 CMD_NEW_GRID = "new-grid"
 CMD_TOGGLE_PLAYBACK = "toggle-playback"
 CMD_SET_DELAY = "set-delay"
 CMD_TICK = "tick"
+CMD_STATS = "stats"
+CMD_KEYFRAME = "keyframe"
 
 CHR_LINE_SEP = "/"
 
+"""Options a client can set when it sends `new-grid`.
+
+They're given as ``key=value`` words before the pattern, e.g.
+
+    new-grid frames=delta keyframe-interval=50 .*./..*/***
+
+`frames` is ``full`` (the default) to send the whole grid every generation,
+or ``delta`` to send a keyframe (the whole grid, preceded by a `keyframe`
+message) and then only the cells that changed each generation, as a single
+`delta` message:
+
+    delta <generation> [+x,y ...] [-x,y ...]
+
+where ``+x,y`` is a cell that was born and ``-x,y`` one that died. Another
+keyframe is sent every `keyframe-interval` generations, or when the client
+sends `keyframe`, so a client that misses a delta can resync.
+
+`encoding` is ``text`` (the default) for the messages above, or ``binary``
+to send every keyframe and delta as a single binary message instead (see
+``conway_server.frames``), which limits the grid to `frames.MAX_SIZE`
+cells wide and high. With ``binary``, `compression` can be set to ``zlib``
+to compress each message.
+
+`session` names a game to share with other clients. The first client to
+use a name creates the game, with its own pattern and options; later ones
+join it and are sent a keyframe, and any options they give must match the
+game's. Every client of a game sees the same frames and can control it.
+The game ends when its last client disconnects.
+"""
+OPT_FRAMES = "frames"
+OPT_KEYFRAME_INTERVAL = "keyframe-interval"
+OPT_ENCODING = "encoding"
+OPT_COMPRESSION = "compression"
+OPT_SESSION = "session"
+
+FRAMES_FULL = "full"
+FRAMES_DELTA = "delta"
+DEFAULT_KEYFRAME_INTERVAL = 100
+ENCODING_TEXT = "text"
+ENCODING_BINARY = "binary"
+COMPRESSION_NONE = "none"
+COMPRESSION_ZLIB = "zlib"
+
+# Allowed values of each option that takes one of a few choices. The first
+# choice is the default.
+OPTION_CHOICES = {
+    OPT_FRAMES: (FRAMES_FULL, FRAMES_DELTA),
+    OPT_ENCODING: (ENCODING_TEXT, ENCODING_BINARY),
+    OPT_COMPRESSION: (COMPRESSION_NONE, COMPRESSION_ZLIB),
+}
+
+# Roughly the longest time, in seconds, to step the grid for in a single
+# call to the executor. Cancelling a tick takes effect between calls, so
+# this bounds how long that takes (give or take one generation).
+TICK_SLICE = 0.05
+
+
+# How many frames can be waiting to be sent to a client. When a client falls
+# this far behind, the frames waiting for it are dropped.
+CLIENT_QUEUE_SIZE = 4
+
+# Messages that make up a single frame or reply, sent to a client in order.
+Messages = Sequence[Union[str, bytes]]
+
+
+class Client:
+    """A connection to a `Controller`.
+
+    Frames and replies are queued rather than sent straight away, and sent
+    in order by a separate task. If the queue fills up because the client
+    can't keep up, everything in it is dropped and `resync` is set, so that
+    a slow client only ever falls behind by a few frames, and never holds up
+    the game or any other client.
+    """
+
+    def __init__(self, websocket: websockets.WebSocketServerProtocol):
+        self.websocket = websocket
+        self.queue: asyncio.Queue = asyncio.Queue(CLIENT_QUEUE_SIZE)
+        # Whether frames were dropped since the client was last sent a
+        # keyframe.
+        self.resync = False
+        self.writer = asyncio.ensure_future(self.write())
+
+    def push(self, messages: Messages):
+        if self.queue.full():
+            self.drop()
+        self.queue.put_nowait(messages)
+
+    def drop(self):
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.resync = True
+
+    async def write(self):
+        try:
+            while True:
+                for message in await self.queue.get():
+                    await self.websocket.send(message)
+        except websockets.ConnectionClosed:
+            pass
+
+    def close(self):
+        self.writer.cancel()
+
 
 class Controller:
+    """A game, played by one or more `Client`s.
+
+    Every frame is encoded once and then queued for each client. Any
+    client can control the game, and replies to its commands (such as
+    errors) are only sent to that client.
+    """
+
     def __init__(
-        self, websocket: websockets.WebSocketServerProtocol, grid: BaseGrid
+        self,
+        grid: BaseGrid,
+        frames: str = FRAMES_FULL,
+        keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL,
+        encoding: str = ENCODING_TEXT,
+        compression: str = COMPRESSION_NONE,
+        name: Optional[str] = None,
     ):
-        self.websocket = websocket
-
         self.grid = grid
+        self.generation = 0
+        # Name of the session, if the game is shared.
+        self.name = name
+        self.clients: Set[Client] = set()
+
+        self.frames = frames
+        self.keyframe_interval = keyframe_interval
+        self.encoding = encoding
+        self.compression = compression
+        self.binary = encoding == ENCODING_BINARY
+        self.compress = compression == COMPRESSION_ZLIB
+        # Live cells as of the last frame sent, and when the last keyframe
+        # was sent, in `delta` mode. Each client is sent a keyframe when it
+        # joins, so the game starts out in sync.
+        self.previous: Set[Point] = set(grid)
+        self.last_keyframe = 0
+        # The last keyframe encoded, and its generation.
+        self.keyframe_cache: Tuple[int, Messages] = (-1, ())
 
         self.delay = 0.35
 
-        self.paused = True
-        self.playback = asyncio.Task(self.pause())
+        # Held while the grid is stepped, so that it's never read or stepped
+        # by two tasks at once.
+        self.lock = asyncio.Lock()
+        # `tick` commands in progress, and other commands waiting for the
+        # lock.
+        self.ticking: Set[asyncio.Task] = set()
+        self.pending: Set[asyncio.Task] = set()
 
-    async def send_grid(self):
-        for line in str(self.grid).splitlines():
-            await self.websocket.send(line)
-        await self.websocket.send("\0")
-
-    async def dispatch(self, command: str, body: Optional[str] = None):
+        self.paused = True
+        self.playback: Optional[asyncio.Task] = None
+
+    @property
+    def options(self) -> Dict[str, Any]:
+        """The `new-grid` options the game was created with."""
+        return {
+            OPT_FRAMES: self.frames,
+            OPT_KEYFRAME_INTERVAL: self.keyframe_interval,
+            OPT_ENCODING: self.encoding,
+            OPT_COMPRESSION: self.compression,
+        }
+
+    async def join(self, client: Client):
+        # Add the client before waiting for the lock, so that the game can't
+        # end while it waits. Until it's sent its first keyframe, any frame
+        # sent in the meantime is replaced by a keyframe.
+        client.resync = True
+        self.clients.add(client)
+        async with self.lock:
+            if client.resync:
+                client.resync = False
+                client.push(self.keyframe())
+
+    def leave(self, client: Client):
+        """Remove `client` from the game, ending the game if it was the
+        last one.
+        """
+        client.close()
+        self.clients.discard(client)
+        if self.clients:
+            return
+        if self.playback:
+            self.playback.cancel()
+        for task in self.ticking | self.pending:
+            task.cancel()
+        if SESSIONS.get(self.name) is self:
+            del SESSIONS[self.name]
+
+    def encode_grid(self) -> Messages:
+        if self.binary:
+            return [
+                binary_frames.encode_keyframe(
+                    self.grid, self.generation, self.compress
+                )
+            ]
+        return [*str(self.grid).splitlines(), "\0"]
+
+    def keyframe(self) -> Messages:
+        """Return the current generation, encoded as a keyframe.
+
+        The encoding is cached, so it's only made once per generation no
+        matter how many clients need it.
+        """
+        generation, messages = self.keyframe_cache
+        if generation != self.generation:
+            messages = self.encode_grid()
+            if self.frames == FRAMES_DELTA and not self.binary:
+                messages = [MSG_KEYFRAME.format(self.generation), *messages]
+            self.keyframe_cache = (self.generation, messages)
+        return messages
+
+    def encode_frame(self) -> Messages:
+        """Return the current generation in the negotiated format."""
+        if (
+            self.frames == FRAMES_FULL
+            or self.generation - self.last_keyframe >= self.keyframe_interval
+        ):
+            self.previous = set(self.grid)
+            self.last_keyframe = self.generation
+            return self.keyframe()
+
+        cells = set(self.grid)
+        births, deaths = cells - self.previous, self.previous - cells
+        self.previous = cells
+        if self.binary:
+            return [
+                binary_frames.encode_delta(
+                    self.grid, self.generation, births, deaths, self.compress
+                )
+            ]
+        return [
+            " ".join(
+                [
+                    MSG_DELTA.format(self.generation),
+                    *(f"+{x},{y}" for x, y in births),
+                    *(f"-{x},{y}" for x, y in deaths),
+                ]
+            )
+        ]
+
+    def send_frame(self):
+        """Send the current generation to every client.
+
+        Clients that had frames dropped are sent a keyframe instead, to
+        bring them back in sync.
+        """
+        frame = self.encode_frame()
+        for client in self.clients:
+            if client.queue.full():
+                client.drop()
+            if client.resync:
+                client.resync = False
+                client.push(self.keyframe())
+            else:
+                client.push(frame)
+
+    def step(self, n: int, timeout: float) -> int:
+        """Step the grid forward up to `n` generations, stopping early once
+        `timeout` seconds have passed.
+
+        Returns the number of generations stepped, which is at least 1.
+        """
+        deadline = time.perf_counter() + timeout
+        for i in range(1, n + 1):
+            self.grid.tick()
+            self.generation += 1
+            if time.perf_counter() >= deadline:
+                return i
+        return n
+
+    async def tick(self, n: int = 1):
+        """Step the grid forward `n` generations without blocking the loop.
+
+        The grid is stepped in the loop's default executor, for about
+        `TICK_SLICE` seconds at a time, so other connections are served
+        while it runs. The lock is only held for one slice at a time, so
+        other commands are answered in between. If this is cancelled, the
+        slice in progress is finished (a thread can't be interrupted) and
+        no more are started.
+        """
+        loop = asyncio.get_running_loop()
+        while n > 0:
+            async with self.lock:
+                future = loop.run_in_executor(None, self.step, n, TICK_SLICE)
+                try:
+                    n -= await asyncio.shield(future)
+                except asyncio.CancelledError:
+                    await future
+                    raise
+
+    async def dispatch(
+        self, client: Client, command: str, body: Optional[str] = None
+    ):
         if command == CMD_TOGGLE_PLAYBACK:
             await self.do_toggle_playback()
         elif command == CMD_SET_DELAY:
-            await self.do_set_delay(body)
+            await self.do_set_delay(client, body)
         elif command == CMD_TICK:
-            await self.do_tick(body)
+            await self.do_tick(client, body)
+        elif command == CMD_STATS:
+            self.spawn(self.do_stats(client))
+        elif command == CMD_KEYFRAME:
+            self.spawn(self.do_keyframe(client))
         else:
-            await self.websocket.send(MSG_INVALID_CMD.format(command))
+            client.push([MSG_INVALID_CMD.format(command)])
+
+    def spawn(self, coro: Awaitable):
+        """Run `coro` in the background, so that it can wait for the lock
+        without holding up the client's other commands.
+        """
+        task = asyncio.ensure_future(coro)
+        self.pending.add(task)
+        task.add_done_callback(self.pending.discard)
 
     async def do_toggle_playback(self):
-        self.playback.cancel()
+        if self.playback:
+            self.playback.cancel()
+        for task in self.ticking:
+            task.cancel()
 
         if self.paused:
             self.playback = asyncio.Task(self.play())
@@ -84,46 +382,80 @@ class Controller:
     async def play(self):
         self.paused = False
         while True:
-            await self.send_grid()
+            async with self.lock:
+                self.send_frame()
             await asyncio.sleep(self.delay)
-            self.grid.tick()
+            await self.tick()
 
     async def pause(self):
         self.paused = True
-        await self.send_grid()
+        async with self.lock:
+            self.send_frame()
 
-    async def do_set_delay(self, delay: Any):
+    async def do_set_delay(self, client: Client, delay: Any):
         if delay is None:
-            return await self.websocket.send(
-                MSG_MISSING_VALUE.format(CMD_SET_DELAY)
-            )
+            return client.push([MSG_MISSING_VALUE.format(CMD_SET_DELAY)])
         try:
             delay = float(delay)
         except ValueError:
-            return await self.websocket.send(
-                MSG_INVALID_VALUE.format(
-                    CMD_SET_DELAY, "a float in the range [0, 1)"
-                )
+            return client.push(
+                [
+                    MSG_INVALID_VALUE.format(
+                        CMD_SET_DELAY, "a float in the range [0, 1)"
+                    )
+                ]
             )
         self.delay = delay
 
-    async def do_tick(self, n: Any):
+    async def do_tick(self, client: Client, n: Any):
         try:
             n = n and int(n) or 1
         except ValueError:
             pass
         if not isinstance(n, int) or n < 1:
-            return await self.websocket.send(
-                MSG_INVALID_VALUE.format(CMD_TICK, "a positive integer")
+            return client.push(
+                [MSG_INVALID_VALUE.format(CMD_TICK, "a positive integer")]
             )
-        for _ in range(n):
-            self.grid.tick()
-        await self.send_grid()
+        # Tick in the background, so that further commands (such as
+        # toggling playback, which cancels this) are still handled.
+        task = asyncio.ensure_future(self.advance(n))
+        self.ticking.add(task)
+        task.add_done_callback(self.ticking.discard)
+
+    async def advance(self, n: int):
+        await self.tick(n)
+        async with self.lock:
+            self.send_frame()
+
+    async def do_keyframe(self, client: Client):
+        async with self.lock:
+            client.push(self.keyframe())
+
+    async def do_stats(self, client: Client):
+        async with self.lock:
+            bounds = self.grid.bounds
+            population = self.grid.population
+        client.push(
+            [
+                MSG_STATS.format(
+                    population,
+                    bounds and ",".join(map(str, bounds)) or "none",
+                )
+            ]
+        )
+
+
+# Shared games, by session name.
+SESSIONS: Dict[str, Controller] = {}
 
 
 async def init_controller(
     websocket: websockets.WebSocketServerProtocol,
-) -> Controller:
+) -> Optional[Controller]:
+    """Set up the game for a new connection, creating or joining it.
+
+    Returns None if the connection is closed first.
+    """
     async for msg in websocket:
         match = RE_MSG.fullmatch(str(msg).strip())
         if not match:
@@ -144,26 +476,135 @@ async def init_controller(
             await websocket.send(MSG_MISSING_VALUE.format(CMD_NEW_GRID))
             continue
 
-        break
+        options, pattern = parse_options(body)
+        name = options.pop(OPT_SESSION, None)
+        if name == "":
+            await websocket.send(
+                MSG_INVALID_VALUE.format(OPT_SESSION, "a name")
+            )
+            continue
+        given = set(options)
+        settings: Dict[str, Any] = {
+            option: options.pop(option, choices[0])
+            for option, choices in OPTION_CHOICES.items()
+        }
+        invalid = [
+            option
+            for option, choices in OPTION_CHOICES.items()
+            if settings[option] not in choices
+        ]
+        if invalid:
+            choices = OPTION_CHOICES[invalid[0]]
+            await websocket.send(
+                MSG_INVALID_VALUE.format(
+                    invalid[0], " or ".join(f"`{c}`" for c in choices)
+                )
+            )
+            continue
+        try:
+            keyframe_interval = int(
+                options.pop(OPT_KEYFRAME_INTERVAL, DEFAULT_KEYFRAME_INTERVAL)
+            )
+            if keyframe_interval < 1:
+                raise ValueError
+            settings[OPT_KEYFRAME_INTERVAL] = keyframe_interval
+        except ValueError:
+            await websocket.send(
+                MSG_INVALID_VALUE.format(
+                    OPT_KEYFRAME_INTERVAL, "a positive integer"
+                )
+            )
+            continue
+        if options:
+            await websocket.send(
+                MSG_CLIENT_ERR.format(
+                    "unknown option(s): {}".format(", ".join(sorted(options)))
+                )
+            )
+            continue
+
+        if name in SESSIONS:
+            # Join the existing game, ignoring the pattern.
+            controller = SESSIONS[name]
+            conflicts = sorted(
+                f"{option}={controller.options[option]}"
+                for option in given
+                if settings[option] != controller.options[option]
+            )
+            if conflicts:
+                await websocket.send(
+                    MSG_CLIENT_ERR.format(
+                        f"session `{name}` was created with "
+                        + ", ".join(conflicts)
+                    )
+                )
+                continue
+            return controller
+
+        if not pattern:
+            await websocket.send(MSG_MISSING_VALUE.format(CMD_NEW_GRID))
+            continue
+
+        grid = Grid.from_str(pattern.replace(CHR_LINE_SEP, "\n"))
+        if settings[OPT_ENCODING] == ENCODING_BINARY and (
+            max(grid.width, grid.height) > binary_frames.MAX_SIZE
+        ):
+            await websocket.send(
+                MSG_CLIENT_ERR.format(
+                    f"{OPT_ENCODING}={ENCODING_BINARY} only supports grids"
+                    f" up to {binary_frames.MAX_SIZE} cells wide and high"
+                )
+            )
+            continue
+
+        controller = Controller(
+            grid,
+            frames=settings[OPT_FRAMES],
+            keyframe_interval=settings[OPT_KEYFRAME_INTERVAL],
+            encoding=settings[OPT_ENCODING],
+            compression=settings[OPT_COMPRESSION],
+            name=name,
+        )
+        if name is not None:
+            SESSIONS[name] = controller
+        return controller
+
+    return None
 
-    body = body.replace(CHR_LINE_SEP, "\n")
-    grid = Grid.from_str(body)
-    return Controller(websocket, grid)
+
+def parse_options(body: str) -> Tuple[Dict[str, str], str]:
+    """Split the leading ``key=value`` options off of a message body.
+
+    Returns the options and the rest of the body.
+    """
+    options = {}
+    words = body.split()
+    while words and "=" in words[0]:
+        key, _, value = words.pop(0).partition("=")
+        options[key] = value
+    return options, " ".join(words)
 
 
 async def server_handler(
     websocket: websockets.WebSocketServerProtocol, path: str
 ):
     controller = await init_controller(websocket)
-
-    async for msg in websocket:
-        match = RE_MSG.fullmatch(str(msg).strip())
-        if not match:
-            await websocket.send(MSG_SYNTAX_ERR)
-            continue
-
-        command, body = match.groups()
-        await controller.dispatch(command, body)
+    if controller is None:
+        return
+
+    client = Client(websocket)
+    try:
+        await controller.join(client)
+        async for msg in websocket:
+            match = RE_MSG.fullmatch(str(msg).strip())
+            if not match:
+                client.push([MSG_SYNTAX_ERR])
+                continue
+
+            command, body = match.groups()
+            await controller.dispatch(client, command, body)
+    finally:
+        controller.leave(client)
 
 
 async def main():
@@ -0,0 +1,146 @@
+"""Binary encoding of the frames sent by the server.
+
+Every frame is a single websocket message made of a `HEADER` followed by a
+payload:
+
+    kind (u8) | flags (u8) | generation (u64) | width (u16) | height (u16)
+
+All numbers are big-endian. If `FLAG_ZLIB` is set in the flags, the
+payload is compressed with zlib. The payload of a `KIND_KEYFRAME` frame is
+every row of the grid, bit-packed with the cell at column ``x`` in bit
+``x % 8`` of byte ``x // 8`` of its row, and each row padded to a whole
+number of bytes. The payload of a `KIND_DELTA` frame is the number of
+births and of deaths (u32 each), followed by the (x, y) of each birth and
+then each death (u16 each), so neither dimension of the grid can be more
+than `MAX_SIZE`.
+"""
+
+import struct
+import zlib
+from typing import Iterable, List, NamedTuple, Set
+
+from conway.grid import BaseGrid, Point
+from conway.grid.bitboard import bytes_to_rows, row_size
+
+HEADER = struct.Struct("!BBQHH")
+COUNTS = struct.Struct("!II")
+
+# The largest width or height, and so x or y, that a frame can hold.
+MAX_SIZE = 0xFFFF
+
+KIND_KEYFRAME = 0
+KIND_DELTA = 1
+
+FLAG_ZLIB = 1
+
+
+class Frame(NamedTuple):
+    """A decoded frame.
+
+    `cells` holds the live cells of a keyframe, and `births` and `deaths`
+    the changes in a delta; the others are empty.
+    """
+
+    kind: int
+    generation: int
+    width: int
+    height: int
+    cells: Set[Point]
+    births: List[Point]
+    deaths: List[Point]
+
+
+def pack_rows(grid: BaseGrid) -> bytes:
+    """Bit-pack every row of `grid`."""
+    size = row_size(grid.width)
+    return b"".join(
+        row.to_bytes(size, "little") for row in bytes_to_rows(grid.to_bytes())
+    )
+
+
+def unpack_rows(data: bytes, width: int, height: int) -> Set[Point]:
+    """Return the live cells of bit-packed rows."""
+    size = row_size(width)
+    cells = set()
+    for y in range(height):
+        row = int.from_bytes(data[y * size : (y + 1) * size], "little")
+        while row:
+            low = row & -row
+            cells.add(Point(low.bit_length() - 1, y))
+            row ^= low
+    return cells
+
+
+def encode(
+    kind: int,
+    generation: int,
+    width: int,
+    height: int,
+    payload: bytes,
+    compress: bool = False,
+) -> bytes:
+    """Add a header to `payload`, compressing it first if `compress`."""
+    flags = 0
+    if compress:
+        payload = zlib.compress(payload)
+        flags |= FLAG_ZLIB
+    return HEADER.pack(kind, flags, generation, width, height) + payload
+
+
+def encode_keyframe(
+    grid: BaseGrid, generation: int, compress: bool = False
+) -> bytes:
+    """Encode the whole of `grid` as a single keyframe."""
+    return encode(
+        KIND_KEYFRAME,
+        generation,
+        grid.width,
+        grid.height,
+        pack_rows(grid),
+        compress,
+    )
+
+
+def encode_delta(
+    grid: BaseGrid,
+    generation: int,
+    births: Iterable[Point],
+    deaths: Iterable[Point],
+    compress: bool = False,
+) -> bytes:
+    """Encode the cells of `grid` that changed since the last frame."""
+    births, deaths = list(births), list(deaths)
+    coords = [n for point in (*births, *deaths) for n in point]
+    payload = COUNTS.pack(len(births), len(deaths)) + struct.pack(
+        f"!{len(coords)}H", *coords
+    )
+    return encode(
+        KIND_DELTA, generation, grid.width, grid.height, payload, compress
+    )
+
+
+def decode(data: bytes) -> Frame:
+    """Decode a frame made by `encode_keyframe` or `encode_delta`."""
+    kind, flags, generation, width, height = HEADER.unpack_from(data)
+    payload = data[HEADER.size :]
+    if flags & FLAG_ZLIB:
+        payload = zlib.decompress(payload)
+
+    if kind == KIND_KEYFRAME:
+        cells = unpack_rows(payload, width, height)
+        return Frame(kind, generation, width, height, cells, [], [])
+
+    births, deaths = COUNTS.unpack_from(payload)
+    coords = struct.unpack_from(
+        f"!{2 * (births + deaths)}H", payload, COUNTS.size
+    )
+    points = [Point(*coords[i : i + 2]) for i in range(0, len(coords), 2)]
+    return Frame(
+        kind,
+        generation,
+        width,
+        height,
+        set(),
+        points[:births],
+        points[births:],
+    )
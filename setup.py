@@ -19,6 +19,13 @@ setup(
     description="A Python implementation of Conway's Game of Life.",
     long_description=readme(),
     include_package_data=True,
-    packages=["conway", "conway_server"],
-    entry_points={"console_scripts": ["conway = conway.__main__:main"]},
+    packages=["conway", "conway_bench", "conway_server"],
+    extras_require={"numpy": ["numpy"]},
+    entry_points={
+        "console_scripts": [
+            "conway = conway.__main__:main",
+            "conway-batch = conway.batch:main",
+            "conway-bench = conway_bench.__main__:main",
+        ]
+    },
 )
@@ -1,4 +1,33 @@
-from conway.grid import BaseGrid, Point
+import random
+from typing import Any, Dict, Set
+
+import pytest
+
+from conway.grid import (
+    FRAME_TABLE,
+    BaseGrid,
+    Bounds,
+    Point,
+    measure_points,
+    random_bytes,
+    zobrist,
+)
+from conway.grid.toroidal import Grid as ToroidalGrid
+
+GLIDER = {Point(1, 0), Point(2, 1), Point(0, 2), Point(1, 2), Point(2, 2)}
+
+
+def soup(seed: int, size: int, offset: int) -> Set[Point]:
+    """Return a random square of cells, `size` cells wide, with its top-left
+    corner at (`offset`, `offset`).
+    """
+    rng = random.Random(seed)
+    return {
+        Point(x + offset, y + offset)
+        for y in range(size)
+        for x in range(size)
+        if rng.random() < 0.5
+    }
 
 
 class GameRulesTestMixin:
@@ -36,3 +65,136 @@ class GameRulesTestMixin:
 
         grid.tick()
         assert grid[Point(1, 1)] == 1
+
+    def test_population_and_bounds(self):
+        """Population and bounds stay in step with the live cells."""
+        grid = self.GRID_CLS.from_str("""
+            ........
+            ..*.....
+            ...*....
+            .***....
+            ........
+            ........
+            """)
+        assert grid.population == 5
+        assert grid.bounds == Bounds(1, 1, 3, 3)
+
+        grid[Point(6, 4)] = True
+        grid[Point(6, 4)] = True
+        assert grid.population == 6
+        assert grid.bounds == Bounds(1, 1, 6, 4)
+
+        grid[Point(6, 4)] = False
+        assert grid.population == 5
+        assert grid.bounds == Bounds(1, 1, 3, 3)
+
+        for _ in range(4):
+            grid.tick()
+            expected = measure_points(
+                point for point, cell in grid.enumerate_cells() if cell
+            )
+            assert (grid.population, grid.bounds) == expected
+            assert len(grid) == grid.population
+
+    def test_str(self):
+        """Grids are drawn one row per line, with `*` for live cells."""
+        pattern = ".*...\n..*..\n***..\n....."
+        grid = self.GRID_CLS.from_str(pattern)
+        assert str(grid) == pattern
+        assert grid.to_bytes() == pattern.encode()
+
+        grid.tick()
+        assert str(grid) == "\n".join(
+            "".join("*" if grid[Point(x, y)] else "." for x in range(5))
+            for y in range(4)
+        )
+
+    def test_fingerprint(self):
+        """The fingerprint is kept up to date with the live cells."""
+        grid = self.GRID_CLS.from_str("""
+            ........
+            ..*.....
+            ...*....
+            .***....
+            ........
+            ........
+            """)
+        assert grid.fingerprint == zobrist(iter(grid))
+
+        grid[Point(6, 4)] = True
+        assert grid.fingerprint == zobrist(iter(grid))
+        grid[Point(6, 4)] = False
+        assert grid.fingerprint == zobrist(iter(grid))
+
+        for _ in range(4):
+            grid.tick()
+            assert grid.fingerprint == zobrist(iter(grid))
+
+    def test_randomize(self):
+        """Seeded randomization is reproducible and the same for every
+        kind of Grid."""
+        grid = self.GRID_CLS(width=9, height=7)
+        grid[Point(0, 0)] = True
+        grid.randomize(k=0.4, seed=7)
+
+        expected = random_bytes(9 * 7, 0.4, seed=7)
+        rows = [expected[y * 9 : (y + 1) * 9] for y in range(7)]
+        assert grid.to_bytes() == b"\n".join(rows).translate(FRAME_TABLE)
+        assert grid.population == expected.count(1)
+        assert grid.fingerprint == zobrist(iter(grid))
+
+        grid.tick()
+        other = self.GRID_CLS(width=9, height=7)
+        other.randomize(k=0.4, seed=7)
+        other.tick()
+        assert str(grid) == str(other)
+
+
+class ToroidalGridTestMixin(GameRulesTestMixin):
+    """Tests for a Grid that wraps around its edges, like
+    ``conway.grid.toroidal.Grid``.
+    """
+
+    # The cells of an empty 3x2 Grid.
+    ZEROED_CELLS: Any
+    # Extra arguments for each Grid built by `test_matches_toroidal_grid`.
+    GRID_KWARGS: Dict[str, Any] = {}
+
+    def assert_zeroed(self, cells: Any):
+        """Check that `cells` are those of an empty 3x2 Grid."""
+        assert cells == self.ZEROED_CELLS
+
+    def test_init_with_width_and_height(self):
+        grid = self.GRID_CLS(width=3, height=2)
+        assert (grid.width, grid.height) == (3, 2)
+        self.assert_zeroed(grid.cells)
+
+        with pytest.raises(ValueError):
+            grid = self.GRID_CLS(width=3)
+        with pytest.raises(ValueError):
+            grid = self.GRID_CLS(height=3)
+        with pytest.raises(ValueError):
+            grid = self.GRID_CLS()
+
+    def test_wraps_around_edges(self):
+        grid = self.GRID_CLS(width=3, height=2)
+        grid[Point(-1, -1)] = True
+        assert grid[Point(2, 1)]
+        assert grid[Point(5, 3)]
+        assert grid.bounds == Bounds(2, 1, 2, 1)
+        grid[Point(5, 3)] = False
+        assert len(grid) == 0
+
+    def test_matches_toroidal_grid(self):
+        rng = random.Random(0)
+        for width, height in ((1, 1), (2, 3), (7, 5), (70, 9)):
+            cells = [
+                [rng.random() < 0.4 for _ in range(width)]
+                for _ in range(height)
+            ]
+            grid = self.GRID_CLS.from_2d_seq(cells, **self.GRID_KWARGS)
+            expected = ToroidalGrid.from_2d_seq(cells)
+            for _ in range(10):
+                grid.tick()
+                expected.tick()
+                assert str(grid) == str(expected)
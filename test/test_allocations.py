@@ -0,0 +1,105 @@
+import sys
+import tracemalloc
+from typing import Callable
+
+import pytest
+
+from conway.grid import BaseGrid
+from conway.grid import Point as P
+from conway.grid.toroidal import Grid as ToroidalGrid
+
+GRID_MODULES = (
+    "conway.grid.bitboard",
+    "conway.grid.cell_set",
+    "conway.grid.flat",
+    "conway.grid.int_set",
+    "conway.grid.lookup",
+    "conway.grid.ndarray",
+    "conway.grid.tiled",
+    "conway.grid.toroidal",
+)
+
+SIZE = 128
+WARMUP = 4
+TURNS = 8
+
+# Most memory a single tick may allocate at once, and how much more memory
+# may be held after several ticks than before them. These catch buffers
+# that are reallocated or grow every tick, but not objects that are freed
+# as soon as they're made, which tracemalloc never sees at once.
+PEAK_BUDGET = 64 * 1024
+GROWTH_BUDGET = 8 * 1024
+
+# Most Points a single tick may create. A 128x128 grid has 16384 cells, so
+# this is blown by creating even one Point per cell.
+POINT_BUDGET = SIZE * SIZE // 16
+
+# The code run to create a Point, through its constructor or ``_make``.
+POINT_CODE = (P.__new__.__code__, P._make.__func__.__code__)
+
+GLIDER = ((1, 0), (2, 1), (0, 2), (1, 2), (2, 2))
+BLINKER = ((0, 0), (1, 0), (2, 0))
+
+
+def mk_cells() -> set:
+    """Return a few gliders and blinkers spread across the grid."""
+    cells = set()
+    for x0, y0 in ((20, 20), (70, 20), (20, 70), (70, 70)):
+        cells.update(P(x0 + x, y0 + y) for x, y in GLIDER)
+        cells.update(P(x0 + x + 30, y0 + y) for x, y in BLINKER)
+    return cells
+
+
+def count_points(func: Callable[[], None]) -> int:
+    """Call `func` and return the number of Points it created."""
+    count = 0
+
+    def profile(frame, event, arg):
+        nonlocal count
+        if event == "call" and frame.f_code in POINT_CODE:
+            count += 1
+
+    sys.setprofile(profile)
+    try:
+        func()
+    finally:
+        sys.setprofile(None)
+    return count
+
+
+def mk_grid(module_name: str) -> BaseGrid:
+    # Skips the NumPy grid if NumPy isn't installed.
+    module = pytest.importorskip(module_name)
+    grid = module.Grid.from_set(mk_cells(), width=SIZE, height=SIZE)
+    for _ in range(WARMUP):
+        grid.tick()
+    return grid
+
+
+@pytest.mark.parametrize("module_name", GRID_MODULES)
+def test_tick_points(module_name):
+    grid = mk_grid(module_name)
+    for _ in range(TURNS):
+        assert count_points(grid.tick) < POINT_BUDGET
+
+
+def test_tick_points_catches_per_cell_tick():
+    # The generic tick visits every cell through a Point.
+    grid = ToroidalGrid.from_set(mk_cells(), width=SIZE, height=SIZE)
+    assert count_points(lambda: BaseGrid.tick(grid)) >= POINT_BUDGET
+
+
+@pytest.mark.parametrize("module_name", GRID_MODULES)
+def test_tick_memory(module_name):
+    grid = mk_grid(module_name)
+
+    tracemalloc.start()
+    try:
+        for _ in range(TURNS):
+            grid.tick()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak < PEAK_BUDGET
+    assert current < GROWTH_BUDGET
@@ -0,0 +1,36 @@
+from conway.batch import Job, mk_jobs, run_batch, simulate
+
+
+def test_mk_jobs():
+    jobs = mk_jobs(range(2), (8, 16), (0.5,), max_turns=10)
+    assert [(job.seed, job.size) for job in jobs] == [
+        (0, 8),
+        (1, 8),
+        (0, 16),
+        (1, 16),
+    ]
+    assert all(job.max_turns == 10 for job in jobs)
+
+
+def test_simulate_is_reproducible():
+    job = Job(seed=3, size=16, density=0.3, max_turns=200)
+    summary = simulate(job)
+    assert summary == simulate(job)
+    assert summary.generations <= job.max_turns
+    if summary.cycle_start is not None:
+        assert summary.generations == (
+            summary.cycle_start + summary.cycle_period
+        )
+
+
+def test_simulate_empty_grid():
+    summary = simulate(Job(seed=0, size=8, density=0.0))
+    assert summary.initial_population == summary.final_population == 0
+    assert (summary.cycle_start, summary.cycle_period) == (0, 1)
+    assert summary.generations == 1
+
+
+def test_run_batch():
+    jobs = mk_jobs(range(4), (16,), (0.3,), max_turns=50)
+    summaries = list(run_batch(jobs, processes=2))
+    assert summaries == [simulate(job) for job in jobs]
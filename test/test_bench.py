@@ -0,0 +1,39 @@
+import conway_bench
+from conway.grid import Point as P
+from conway.grid.bitboard import Grid as BitboardGrid
+from conway.grid.cell_set import Grid as CellSetGrid
+
+
+def test_pattern_cells():
+    cells = conway_bench.pattern_cells("*.\n.*", size=6)
+    assert cells == {P(2, 2), P(3, 3)}
+
+
+def test_run_benchmarks():
+    grid_types = {"bitboard": BitboardGrid, "cell_set": CellSetGrid}
+    results = list(
+        conway_bench.run_benchmarks(
+            grid_types,
+            sizes=[8],
+            densities=[0.5],
+            patterns={"blinker": "***"},
+            min_turns=2,
+            max_time=0,
+        )
+    )
+
+    assert [(r["grid"], r["workload"]) for r in results] == [
+        ("bitboard", "random"),
+        ("cell_set", "random"),
+        ("bitboard", "blinker"),
+        ("cell_set", "blinker"),
+    ]
+    for result in results:
+        assert result["turns"] == 2
+        assert result["generations_per_second"] > 0
+        assert result["peak_memory"] > 0
+        assert set(result["construction"]) == {
+            "from_str",
+            "from_set",
+            "randomize",
+        }
@@ -0,0 +1,52 @@
+from conway.grid import Point as P
+from conway.grid.bitboard import (
+    BitRows,
+    Grid,
+    bytes_to_rows,
+    next_row,
+    pack_row,
+    rows_to_bytes,
+)
+
+from . import ToroidalGridTestMixin
+
+
+def test_pack_row():
+    assert pack_row([]) == 0
+    assert pack_row([1, 0, 0]) == 0b001
+    assert pack_row([0, 1, 1]) == 0b110
+
+
+def test_bytes_to_rows():
+    rows = [0b001, 0b110, 0]
+    assert rows_to_bytes(rows, 3) == b"*..\n.**\n..."
+    assert bytes_to_rows(rows_to_bytes(rows, 3)) == rows
+
+
+def test_next_row():
+    # Each bit has the same neighbor count in every column.
+    for count in range(9):
+        neighbors = [0b11] * count + [0] * (8 - count)
+        dead_next = next_row(0b00, neighbors)
+        live_next = next_row(0b11, neighbors)
+        assert dead_next == (0b11 if count == 3 else 0)
+        assert live_next == (0b11 if count in (2, 3) else 0)
+
+
+class TestGrid(ToroidalGridTestMixin):
+    GRID_CLS = Grid
+    ZEROED_CELLS = [0, 0]
+
+    def test_init_with_cells(self):
+        assert Grid(width=3, height=2).cells.width == 3
+
+        grid = Grid(cells=BitRows([0b001, 0b110]))
+        assert (grid.width, grid.height) == (3, 2)
+
+        grid = Grid(cells=BitRows([0b001, 0b110]), width=4, height=3)
+        assert (grid.width, grid.height) == (4, 3)
+        assert grid.cells == [0b001, 0b110, 0]
+
+        grid = Grid.from_set({P(1, 1), P(1, 2)}, width=4)
+        assert (grid.width, grid.height) == (4, 3)
+        assert set(grid) == {P(1, 1), P(1, 2)}
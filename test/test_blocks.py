@@ -0,0 +1,60 @@
+import pytest
+
+from conway.blocks import BLOCK_SIZE, BlockPlane
+from conway.grid import Bounds
+from conway.grid import Point as P
+from conway.grid.cell_set import Grid
+from conway.hashlife import HashLife
+
+from . import GLIDER, soup
+
+
+def test_from_set():
+    plane = BlockPlane.from_set(GLIDER)
+    assert len(plane) == 5
+    assert set(plane) == GLIDER
+    assert P(1, 0) in plane
+    assert P(0, 0) not in plane
+    assert P(-100, 100) not in plane
+    assert plane.bounds() == Bounds(0, 0, 2, 2)
+
+    with pytest.raises(TypeError):
+        (1, 0) in plane
+
+    plane = BlockPlane.from_set(set())
+    assert len(plane) == 0
+    assert set(plane) == set()
+    assert plane.bounds() is None
+
+
+def test_from_grid_and_to_grid():
+    grid = Grid.from_set(GLIDER, width=10, height=10)
+    plane = BlockPlane.from_grid(grid)
+    assert set(plane) == GLIDER
+
+    grid = plane.to_grid(Grid, width=2, height=3)
+    assert set(grid) == {P(1, 0), P(0, 2), P(1, 2)}
+
+
+def test_matches_hashlife():
+    # The soup straddles the corners of four blocks around the origin.
+    cells = soup(seed=1, size=40, offset=-20)
+    plane = BlockPlane.from_set(cells)
+    life = HashLife.from_set(cells)
+    for _ in range(40):
+        plane.tick()
+        life.advance(1)
+        assert set(plane) == set(life)
+        assert len(plane) == len(life)
+    assert plane.generation == 40
+
+
+def test_blocks_follow_the_pattern():
+    plane = BlockPlane.from_set(GLIDER)
+    for _ in range(4 * BLOCK_SIZE * 10):
+        plane.tick()
+        assert len(plane.blocks) <= 4
+
+    # The glider has moved 10 blocks down and to the right.
+    offset = BLOCK_SIZE * 10
+    assert set(plane) == {P(x + offset, y + offset) for x, y in GLIDER}
@@ -1,6 +1,6 @@
 import pytest
 
-from conway.grid import Cell
+from conway.grid import BaseGrid, Bounds, Cell
 from conway.grid import Point as P
 from conway.grid.cell_set import Grid
 
@@ -66,3 +66,51 @@ class TestGrid(GameRulesTestMixin):
             grid = Grid(cells=set(), width=2)
         with pytest.raises(ValueError):
             grid = Grid(cells=set(), height=2)
+
+    def test_cells_evaluated(self):
+        # A vertical blinker's 3 live cells are all among the 15 cells
+        # next to a live cell, and are only counted once.
+        grid = Grid.from_set({P(2, 1), P(2, 2), P(2, 3)}, width=5, height=5)
+        grid.tick()
+        assert grid.cells_evaluated == 15
+
+    def test_str_skips_cells_outside_grid(self):
+        grid = Grid(width=3, height=2)
+        for point in (P(5, 5), P(4, 0), P(-1, 1)):
+            grid[point] = True
+        assert grid.to_bytes() == b"...\n..."
+        assert str(grid) == "...\n..."
+
+    def test_setitem_outside_grid(self):
+        # The cell is stored where it's set, but isn't part of the Grid.
+        grid = Grid(width=5, height=5)
+        grid[P(1, 1)] = True
+        grid[P(7, 1)] = True
+        assert grid.cells == {P(1, 1), P(7, 1)}
+        assert grid[P(7, 1)]
+        assert set(grid) == {P(1, 1)}
+        assert len(grid) == 1
+        assert grid.bounds == Bounds(1, 1, 1, 1)
+
+        grid[P(7, 1)] = False
+        assert len(grid) == 1
+        grid.recount()
+        assert len(grid) == 1
+        assert grid.bounds == Bounds(1, 1, 1, 1)
+
+        # It dies on the next tick.
+        grid[P(5, 1)] = True
+        grid.tick()
+        assert grid.cells == set()
+        assert len(grid) == 0
+
+    def test_tick_matches_full_scan(self):
+        pattern = "\n".join(
+            ["*....*..", "..*.**..", ".***....", "......**", "*......*"]
+        )
+        grid = Grid.from_str(pattern)
+        expected = Grid.from_str(pattern)
+        for _ in range(20):
+            grid.tick()
+            BaseGrid.tick(expected)
+            assert grid.cells == expected.cells
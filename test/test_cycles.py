@@ -0,0 +1,52 @@
+import conway
+from conway.cycles import Cycle, CycleDetector
+from conway.grid.cell_set import Grid
+from conway.grid.lookup import Grid as LookupGrid
+
+BLINKER = ".....\n..*..\n..*..\n..*..\n....."
+GLIDER = ".*...\n..*..\n***..\n.....\n....."
+
+
+def test_still_life():
+    grid = Grid.from_str("....\n.**.\n.**.\n....")
+    cycles = CycleDetector()
+    assert cycles.check(grid) is None
+    grid.tick()
+    assert cycles.check(grid) == Cycle(start=0, period=1)
+    assert str(cycles.cycle) == "still life from generation 0"
+
+
+def test_dies_out():
+    grid = Grid.from_str("*..\n...\n..*")
+    cycles = CycleDetector()
+    frames = list(conway.run_iter(grid, cycles=cycles))
+    # The cells die, then the empty grid repeats.
+    assert len(frames) == 3
+    assert cycles.cycle == Cycle(start=1, period=1)
+
+
+def test_oscillator():
+    grid = Grid.from_str(BLINKER)
+    cycles = CycleDetector()
+    frames = list(conway.run_iter(grid, cycles=cycles))
+    assert len(frames) == 3
+    assert cycles.cycle == Cycle(start=0, period=2)
+    assert str(cycles.cycle) == "period 2 cycle from generation 0"
+
+
+def test_spaceship_on_a_torus():
+    # A glider returns to where it started after crossing a 5x5 torus,
+    # which takes 4 generations per cell.
+    grid = LookupGrid.from_str(GLIDER)
+    cycles = CycleDetector()
+    generations, _ = conway.fast_forward(grid, turns=100, cycles=cycles)
+    assert cycles.cycle == Cycle(start=0, period=20)
+    assert generations == 20
+
+
+def test_max_period():
+    grid = LookupGrid.from_str(GLIDER)
+    cycles = CycleDetector(max_period=10)
+    conway.fast_forward(grid, turns=100, cycles=cycles)
+    assert cycles.cycle is None
+    assert cycles.generation == 101
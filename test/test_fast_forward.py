@@ -0,0 +1,58 @@
+import io
+import sys
+
+import pytest
+
+import conway
+from conway.__main__ import main
+from conway.grid.cell_set import Grid
+from conway.metrics import Metrics
+
+BLINKER = ".....\n..*..\n..*..\n..*..\n....."
+
+
+def test_fast_forward_without_rendering():
+    grid = Grid.from_str(BLINKER)
+    out = io.StringIO()
+    generations, elapsed = conway.fast_forward(grid, turns=3, out=out)
+    assert generations == 3
+    assert elapsed >= 0
+    assert out.getvalue() == ""
+    assert str(grid) == ".....\n.....\n.***.\n.....\n....."
+
+
+def test_fast_forward_every():
+    grid = Grid.from_str(BLINKER)
+    out = io.StringIO()
+    metrics = Metrics()
+    conway.fast_forward(grid, turns=5, every=2, out=out, metrics=metrics)
+    # Generations 2 and 4 are drawn, and all 5 are measured.
+    assert out.getvalue() == 2 * (conway.draw(Grid.from_str(BLINKER)) + "\n")
+    assert [stats.generation for stats in metrics.history] == [1, 2, 3, 4, 5]
+
+
+def run_main(monkeypatch, *args: str):
+    monkeypatch.setattr(sys, "argv", ["conway", *args])
+    main()
+
+
+def test_no_render_stops_on_cycle(monkeypatch, capsys):
+    run_main(
+        monkeypatch, "--sample", "blinker", "--no-render", "--stop-on-cycle"
+    )
+    assert "stopped: found a" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ("--no-render",),
+        ("--final-only",),
+        ("--diff", "--every", "2"),
+        ("--diff", "--no-render", "--turns", "3"),
+    ],
+)
+def test_invalid_args(monkeypatch, args):
+    with pytest.raises(SystemExit) as exc_info:
+        run_main(monkeypatch, "--sample", "blinker", *args)
+    assert exc_info.value.code == 2
@@ -0,0 +1,62 @@
+import pytest
+
+from conway.grid import Point as P
+from conway.grid.flat import FlatCells, Grid, edge_spans, mk_neighbor_table
+
+from . import ToroidalGridTestMixin
+
+
+def test_edge_spans():
+    assert edge_spans(1) == [(0, 1)]
+    assert edge_spans(2) == [(0, 1), (1, 2)]
+    assert edge_spans(5) == [(0, 1), (1, 4), (4, 5)]
+
+
+def test_mk_neighbor_table():
+    width, height = 4, 3
+    table = mk_neighbor_table(width, height)
+    assert len(table) == 9
+
+    indices = sorted(i for _, spans in table for span in spans for i in span)
+    assert indices == list(range(width * height))
+
+    for offsets, spans in table:
+        for span in spans:
+            for i in span:
+                y, x = divmod(i, width)
+                neighbors = sorted(i + offset for offset in offsets)
+                assert neighbors == sorted(
+                    (y + dy) % height * width + (x + dx) % width
+                    for dx in (-1, 0, 1)
+                    for dy in (-1, 0, 1)
+                    if dx or dy
+                )
+
+
+class TestGrid(ToroidalGridTestMixin):
+    GRID_CLS = Grid
+    ZEROED_CELLS = bytearray(6)
+
+    def test_init_with_cells(self):
+        grid = Grid(cells=FlatCells(b"\1\0\0\0\1\1", width=3, height=2))
+        assert (grid.width, grid.height) == (3, 2)
+        assert set(grid) == {P(0, 0), P(1, 1), P(2, 1)}
+
+        grid = Grid(
+            cells=FlatCells(b"\1\0\0\0\1\1", width=3, height=2),
+            width=4,
+            height=3,
+        )
+        assert (grid.width, grid.height) == (4, 3)
+        assert grid.cells == bytearray(b"\1\0\0\0\0\1\1\0\0\0\0\0")
+
+        with pytest.raises(ValueError):
+            grid = Grid(cells=FlatCells(bytes(6), width=3, height=2), width=2)
+
+        grid = Grid.from_2d_seq([[1, 0, 0], [0, 1]])
+        assert (grid.width, grid.height) == (3, 2)
+        assert set(grid) == {P(0, 0), P(1, 1)}
+
+        grid = Grid.from_set({P(1, 1), P(1, 2)}, width=4)
+        assert (grid.width, grid.height) == (4, 3)
+        assert set(grid) == {P(1, 1), P(1, 2)}
@@ -0,0 +1,38 @@
+import pytest
+
+from conway.grid import Point as P
+from conway.grid.cell_set import Grid
+from conway_server import frames
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_keyframe_round_trip(compress):
+    cells = {P(0, 0), P(7, 0), P(8, 1), P(10, 2), P(3, 2)}
+    grid = Grid.from_set(cells, width=11, height=3)
+    data = frames.encode_keyframe(grid, 42, compress=compress)
+
+    frame = frames.decode(data)
+    assert frame.kind == frames.KIND_KEYFRAME
+    assert (frame.generation, frame.width, frame.height) == (42, 11, 3)
+    assert frame.cells == cells
+    if not compress:
+        assert len(data) == frames.HEADER.size + 3 * frames.row_size(11)
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_delta_round_trip(compress):
+    grid = Grid(width=300, height=5)
+    births, deaths = [P(1, 2), P(299, 4)], [P(0, 0)]
+    data = frames.encode_delta(grid, 7, births, deaths, compress=compress)
+
+    frame = frames.decode(data)
+    assert frame.kind == frames.KIND_DELTA
+    assert (frame.generation, frame.width, frame.height) == (7, 300, 5)
+    assert (frame.births, frame.deaths) == (births, deaths)
+    assert not frame.cells
+
+
+def test_generation_past_u32():
+    grid = Grid.from_set({P(1, 1)}, width=3, height=3)
+    frame = frames.decode(frames.encode_keyframe(grid, 2**32 + 5))
+    assert frame.generation == 2**32 + 5
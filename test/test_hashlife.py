@@ -0,0 +1,72 @@
+import pytest
+
+from conway.grid import Point as P
+from conway.grid.cell_set import Grid
+from conway.hashlife import HashLife
+
+from . import GLIDER, soup
+
+
+def test_from_set():
+    life = HashLife.from_set(GLIDER)
+    assert len(life) == 5
+    assert set(life) == GLIDER
+    assert P(1, 0) in life
+    assert P(0, 0) not in life
+    assert P(-100, 100) not in life
+
+    life = HashLife.from_set(set())
+    assert len(life) == 0
+    assert set(life) == set()
+
+
+def test_from_grid_and_to_grid():
+    grid = Grid.from_set(GLIDER, width=10, height=10)
+    life = HashLife.from_grid(grid)
+    assert set(life) == GLIDER
+
+    grid = life.to_grid(Grid, width=2, height=3)
+    assert (grid.width, grid.height) == (2, 3)
+    assert set(grid) == {P(1, 0), P(0, 2), P(1, 2)}
+
+
+def test_advance_glider():
+    life = HashLife.from_set(GLIDER)
+    life.advance(4)
+    assert life.generation == 4
+    assert set(life) == {P(x + 1, y + 1) for x, y in GLIDER}
+
+    life.advance(4000)
+    assert life.generation == 4004
+    assert set(life) == {P(x + 1001, y + 1001) for x, y in GLIDER}
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_advance_matches_grid(seed):
+    cells = soup(seed, size=8, offset=46)
+    grid = Grid.from_set(cells, width=100, height=100)
+    life = HashLife.from_set(cells)
+
+    for steps in (1, 1, 2, 3, 8, 5):
+        for _ in range(steps):
+            grid.tick()
+        life.advance(steps)
+        assert set(life) == set(grid)
+
+
+def test_collect():
+    cells = soup(0, size=16, offset=0)
+    expected = HashLife.from_set(cells)
+    expected.advance(200)
+
+    life = HashLife.from_set(cells, max_cache_size=500)
+    for _ in range(200):
+        life.advance(1)
+    assert set(life) == set(expected)
+
+    life.collect()
+    assert not life._results
+    assert set(life) == set(expected)
+    life.advance(100)
+    expected.advance(100)
+    assert set(life) == set(expected)
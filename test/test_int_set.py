@@ -0,0 +1,99 @@
+import random
+
+import pytest
+
+from conway.grid import Bounds
+from conway.grid import Point as P
+from conway.grid.cell_set import Grid as CellSetGrid
+from conway.grid.int_set import Grid, decode, encode
+
+from . import GameRulesTestMixin
+
+
+def test_encode_decode():
+    for point in (P(0, 0), P(5, 0), P(0, 7), P(1234, 5678), P(3, -2)):
+        assert decode(encode(point)) == point
+    assert encode(P(3, 1)) > encode(P(100, 0))
+    with pytest.raises(ValueError):
+        encode(P(-1, 0))
+    with pytest.raises(ValueError):
+        encode(P(1 << 32, 0))
+
+
+class TestGrid(GameRulesTestMixin):
+    GRID_CLS = Grid
+
+    def test_init_with_width_and_height(self):
+        grid = Grid(width=3, height=2)
+        assert (grid.width, grid.height) == (3, 2)
+        assert grid.cells == set()
+
+        with pytest.raises(ValueError):
+            grid = Grid(width=3)
+        with pytest.raises(ValueError):
+            grid = Grid()
+
+    def test_init_with_cells(self):
+        grid = Grid.from_set({P(0, 0), P(1, 1), P(2, 1)})
+        assert (grid.width, grid.height) == (3, 2)
+        assert set(grid) == {P(0, 0), P(1, 1), P(2, 1)}
+
+        grid = Grid.from_set({P(1, 1), P(1, 2)}, width=4)
+        assert (grid.width, grid.height) == (4, 3)
+
+        with pytest.raises(ValueError):
+            grid = Grid.from_set({P(1, 1), P(1, 2)}, height=2)
+
+    def test_out_of_bounds(self):
+        grid = Grid.from_set({P(0, 0), P(2, 1)}, width=3, height=2)
+        assert not grid[P(-1, 0)]
+        assert not grid[P(3, 0)]
+        assert not grid[P(0, -1)]
+        assert not grid[P(0, 2)]
+
+    def test_setitem_out_of_range(self):
+        grid = Grid(width=5, height=5)
+        with pytest.raises(ValueError):
+            grid[P(-1, 1)] = True
+        assert not grid.cells
+        assert grid.bounds is None
+
+        # Stored, but not part of the Grid, and dies on the next tick.
+        grid[P(1, 1)] = True
+        grid[P(7, -1)] = True
+        assert grid[P(7, -1)]
+        assert set(grid) == {P(1, 1)}
+        assert len(grid) == 1
+        grid.recount()
+        assert grid.bounds == Bounds(1, 1, 1, 1)
+
+        # A block outside the Grid would survive if it were counted.
+        for x, y in ((5, 0), (6, 0), (5, 1), (6, 1)):
+            grid[P(x, y)] = True
+        grid.tick()
+        assert grid.cells == set()
+
+    def test_cells_evaluated(self):
+        # A vertical blinker's 3 live cells are all among the 15 cells
+        # next to a live cell, and are only counted once.
+        grid = Grid.from_set({P(2, 1), P(2, 2), P(2, 3)}, width=5, height=5)
+        grid.tick()
+        assert grid.cells_evaluated == 15
+
+    def test_str_skips_cells_outside_grid(self):
+        grid = Grid(width=3, height=2)
+        grid[P(7, -1)] = True
+        grid[P(3, 1)] = True
+        assert str(grid) == "...\n..."
+
+    def test_matches_cell_set_grid(self):
+        rng = random.Random(0)
+        cells = {
+            P(x, y) for y in range(20) for x in range(24) if rng.random() < 0.4
+        }
+        grid = Grid.from_set(cells, width=24, height=20)
+        expected = CellSetGrid.from_set(cells, width=24, height=20)
+        for _ in range(30):
+            grid.tick()
+            expected.tick()
+            assert set(grid) == expected.cells
@@ -0,0 +1,35 @@
+from conway.grid import Point as P
+from conway.grid.lookup import RULE_TABLE, Grid, column_codes
+
+from . import ToroidalGridTestMixin
+
+
+def test_rule_table():
+    assert len(RULE_TABLE) == 512
+    # Dead cell with 3 live neighbors.
+    assert RULE_TABLE[0b111_000_000] == 1
+    # Live cell with 2 live neighbors.
+    assert RULE_TABLE[0b100_010_001] == 1
+    # Live cell with 4 live neighbors.
+    assert RULE_TABLE[0b101_010_101] == 0
+    # Dead cell with 2 live neighbors.
+    assert RULE_TABLE[0b100_000_001] == 0
+
+
+def test_column_codes():
+    codes = column_codes(b"\1\0\1", b"\0\1\1", b"\0\0\1")
+    assert codes == bytes([0b100, 0b010, 0b111])
+
+
+class TestGrid(ToroidalGridTestMixin):
+    GRID_CLS = Grid
+    ZEROED_CELLS = [bytearray(3), bytearray(3)]
+
+    def test_init_with_cells(self):
+        grid = Grid.from_2d_seq([[1, 0, 0], [0, 1]])
+        assert (grid.width, grid.height) == (3, 2)
+        assert grid.cells == [bytearray(b"\1\0\0"), bytearray(b"\0\1\0")]
+
+        grid = Grid.from_set({P(1, 1), P(1, 2)}, width=4)
+        assert (grid.width, grid.height) == (4, 3)
+        assert set(grid) == {P(1, 1), P(1, 2)}
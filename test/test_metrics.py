@@ -0,0 +1,59 @@
+import io
+import json
+
+import conway
+from conway.grid import Point as P
+from conway.grid.cell_set import Grid
+from conway.grid.lookup import Grid as LookupGrid
+from conway.metrics import Metrics, TickStats, json_lines_writer
+
+BLINKER = {P(1, 0), P(1, 1), P(1, 2)}
+
+
+def test_tick():
+    grid = Grid.from_set(BLINKER, width=3, height=3)
+    metrics = Metrics()
+
+    stats = metrics.tick(grid)
+    assert stats.generation == 1
+    assert stats.tick_time > 0
+    assert stats.cells_evaluated == grid.cells_evaluated
+    assert (stats.births, stats.deaths, stats.population) == (2, 2, 3)
+    assert not metrics.history
+
+    with metrics.time_render(stats):
+        str(grid)
+    assert stats.render_time > 0
+
+    metrics.record(stats)
+    assert list(metrics.history) == [stats]
+
+
+def test_tick_without_tracking_changes():
+    grid = LookupGrid.from_set(BLINKER, width=3, height=3)
+    stats = Metrics(track_changes=False).tick(grid)
+    assert stats.cells_evaluated == 9
+    assert (stats.births, stats.deaths, stats.population) == (0, 0, 9)
+
+
+def test_run_iter_with_metrics():
+    grid = Grid.from_set(BLINKER, width=3, height=3)
+    seen = []
+    metrics = Metrics(callbacks=[seen.append], history=2)
+
+    frames = list(conway.run_iter(grid, turns=3, metrics=metrics))
+    assert len(frames) == 4
+    assert [stats.generation for stats in seen] == [1, 2, 3]
+    assert [stats.generation for stats in metrics.history] == [2, 3]
+    assert all(stats.render_time > 0 for stats in seen)
+
+
+def test_run_with_metrics():
+    grid = Grid.from_set(BLINKER, width=3, height=3)
+    out = io.StringIO()
+    metrics = Metrics(callbacks=[json_lines_writer(out)])
+
+    conway.run(grid, turns=2, delay=0, out=io.StringIO(), metrics=metrics)
+    lines = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [line["generation"] for line in lines] == [1, 2]
+    assert set(lines[0]) == set(TickStats.__dataclass_fields__)
@@ -0,0 +1,79 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from conway.grid import Point as P
+from conway.grid.ndarray import Grid, GridStack
+from conway.grid.toroidal import Grid as ToroidalGrid
+
+from . import ToroidalGridTestMixin
+
+
+class TestGrid(ToroidalGridTestMixin):
+    GRID_CLS = Grid
+
+    def assert_zeroed(self, cells):
+        assert cells.shape == (2, 3)
+        assert not cells.any()
+
+    def test_init_with_cells(self):
+        grid = Grid.from_2d_seq([[1, 0, 0], [0, 1]])
+        assert (grid.width, grid.height) == (3, 2)
+        assert grid.cells.tolist() == [
+            [True, False, False],
+            [False, True, False],
+        ]
+
+        grid = Grid.from_set({P(1, 1), P(1, 2)}, width=4)
+        assert (grid.width, grid.height) == (4, 3)
+        assert set(grid) == {P(1, 1), P(1, 2)}
+
+
+class TestGridStack:
+    def test_matches_grids(self):
+        stack = GridStack.random(6, width=8, height=7, k=0.4, seed=1)
+        grids = [stack[index] for index in range(len(stack))]
+        for _ in range(10):
+            stack.tick()
+            for index, grid in enumerate(grids):
+                grid.tick()
+                if stack.active[index]:
+                    assert np.array_equal(stack.cells[index], grid.cells)
+
+    def test_random_matches_randomize(self):
+        stack = GridStack.random(3, width=8, height=7, k=0.4, seed=5)
+        for index in range(len(stack)):
+            grid = ToroidalGrid(width=8, height=7)
+            grid.randomize(0.4, seed=5 + index)
+            assert set(stack[index]) == set(grid)
+
+    def test_from_grids(self):
+        grids = [
+            Grid.from_set({P(1, 1), P(2, 1), P(3, 1)}, width=5, height=5),
+            Grid.from_set(set(), width=5, height=5),
+            ToroidalGrid.from_set({P(0, 0)}, width=5, height=5),
+        ]
+        stack = GridStack.from_grids(grids)
+        assert stack.populations().tolist() == [3, 0, 1]
+        assert set(stack[0]) == set(grids[0])
+
+        with pytest.raises(ValueError):
+            GridStack.from_grids([Grid(3, 3), Grid(4, 3)])
+
+    def test_stabilized_grids_stop(self):
+        block = {P(1, 1), P(2, 1), P(1, 2), P(2, 2)}
+        blinker = {P(1, 2), P(2, 2), P(3, 2)}
+        glider = {P(1, 0), P(2, 1), P(0, 2), P(1, 2), P(2, 2)}
+        stack = GridStack.from_grids(
+            [
+                Grid.from_set(cells, width=6, height=6)
+                for cells in (block, blinker, glider)
+            ]
+        )
+        for _ in range(3):
+            stack.tick()
+
+        assert stack.active.tolist() == [False, False, True]
+        assert stack.periods.tolist() == [1, 2, 0]
+        assert stack.cycle_starts.tolist() == [0, 0, -1]
+        assert set(stack[0]) == block
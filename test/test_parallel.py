@@ -0,0 +1,46 @@
+import random
+
+import pytest
+
+from conway.grid import Point as P
+from conway.grid.bitboard import Grid as BitboardGrid
+from conway.grid.toroidal import Grid
+from conway.parallel import ParallelGrid
+
+
+def test_init():
+    with ParallelGrid(width=3, height=2, processes=1) as grid:
+        assert (grid.width, grid.height) == (3, 2)
+        assert len(grid) == 0
+        assert str(grid) == "...\n..."
+
+    with pytest.raises(ValueError):
+        ParallelGrid(width=0, height=2)
+
+
+@pytest.mark.parametrize("grid_cls", [Grid, BitboardGrid])
+def test_from_grid_and_to_grid(grid_cls):
+    cells = {P(1, 0), P(2, 1), P(0, 2), P(1, 2), P(2, 2)}
+    grid = grid_cls.from_set(cells, width=5, height=4)
+    with ParallelGrid.from_grid(grid, processes=1) as parallel:
+        assert len(parallel) == 5
+        assert set(parallel) == cells
+        assert str(parallel) == str(grid)
+        assert set(parallel.to_grid(Grid)) == cells
+
+
+@pytest.mark.parametrize(
+    "width,height,bands", [(37, 23, 3), (9, 4, 4), (70, 5, 2), (3, 1, 1)]
+)
+def test_tick_matches_toroidal_grid(width, height, bands):
+    rng = random.Random(width * height)
+    grid = Grid.from_2d_seq(
+        [[rng.random() < 0.4 for _ in range(width)] for _ in range(height)]
+    )
+    with ParallelGrid.from_grid(grid, processes=2, bands=bands) as parallel:
+        for n in (1, 1, 3, 5):
+            for _ in range(n):
+                grid.tick()
+            parallel.tick(n)
+            assert str(parallel) == str(grid)
+        assert parallel.generation == 10
@@ -0,0 +1,401 @@
+import asyncio
+from typing import Callable, List, Set, Tuple
+
+import pytest
+
+pytest.importorskip("websockets")
+
+from conway.grid import Point as P
+from conway_server import __main__ as server
+from conway_server import frames
+
+# How long to wait for the server to send something before failing.
+TIMEOUT = 5
+
+BLINKER = ".*./.*./.*."
+
+
+class FakeWebSocket:
+    """Stands in for a client's websocket, recording what's sent to it."""
+
+    def __init__(self):
+        self.incoming: asyncio.Queue = asyncio.Queue()
+        self.sent: List = []
+
+    async def send(self, message):
+        self.sent.append(message)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        message = await self.incoming.get()
+        if message is None:
+            raise StopAsyncIteration
+        return message
+
+    def connect(self) -> asyncio.Task:
+        """Start serving this websocket."""
+        return asyncio.ensure_future(server.server_handler(self, "/"))
+
+    def receive(self, *messages: str):
+        """Queue messages from the client."""
+        for message in messages:
+            self.incoming.put_nowait(message)
+
+    def close(self):
+        self.incoming.put_nowait(None)
+
+    async def wait_for(self, count: int) -> List:
+        """Wait until `count` messages have been sent, then return and
+        forget them.
+        """
+        await wait_until(lambda: len(self.sent) >= count)
+        messages, self.sent = self.sent[:count], self.sent[count:]
+        return messages
+
+
+async def wait_until(condition: Callable[[], bool]):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + TIMEOUT
+    while not condition():
+        assert loop.time() < deadline, "timed out"
+        await asyncio.sleep(0.001)
+
+
+def parse_delta(message: str) -> Tuple[int, Set[P], Set[P]]:
+    """Split a `delta` message into its generation, births and deaths."""
+    name, generation, *changes = message.split()
+    assert name == "delta"
+    births, deaths = set(), set()
+    for change in changes:
+        x, y = map(int, change[1:].split(","))
+        (births if change[0] == "+" else deaths).add(P(x, y))
+    return int(generation), births, deaths
+
+
+def test_full_frames():
+    async def main():
+        ws = FakeWebSocket()
+        handler = ws.connect()
+        ws.receive(f"new-grid {BLINKER}")
+        assert await ws.wait_for(4) == [".*.", ".*.", ".*.", "\0"]
+
+        ws.receive("tick")
+        assert await ws.wait_for(4) == ["...", "***", "...", "\0"]
+        ws.close()
+        await handler
+
+    asyncio.run(main())
+
+
+def test_delta_frames():
+    async def main():
+        ws = FakeWebSocket()
+        handler = ws.connect()
+        ws.receive(f"new-grid frames=delta keyframe-interval=3 {BLINKER}")
+        assert await ws.wait_for(5) == [
+            "keyframe 0",
+            ".*.",
+            ".*.",
+            ".*.",
+            "\0",
+        ]
+
+        ws.receive("tick")
+        [delta] = await ws.wait_for(1)
+        assert parse_delta(delta) == (
+            1,
+            {P(0, 1), P(2, 1)},
+            {P(1, 0), P(1, 2)},
+        )
+        ws.receive("tick")
+        [delta] = await ws.wait_for(1)
+        assert parse_delta(delta) == (
+            2,
+            {P(1, 0), P(1, 2)},
+            {P(0, 1), P(2, 1)},
+        )
+
+        # A keyframe every `keyframe-interval` generations.
+        ws.receive("tick")
+        assert await ws.wait_for(5) == [
+            "keyframe 3",
+            "...",
+            "***",
+            "...",
+            "\0",
+        ]
+        ws.receive("tick")
+        [delta] = await ws.wait_for(1)
+        assert parse_delta(delta)[0] == 4
+
+        # Or whenever the client asks for one.
+        ws.receive("keyframe")
+        assert await ws.wait_for(5) == [
+            "keyframe 4",
+            ".*.",
+            ".*.",
+            ".*.",
+            "\0",
+        ]
+        ws.close()
+        await handler
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize(
+    "options,error",
+    [
+        (
+            "frames=partial",
+            server.MSG_INVALID_VALUE.format("frames", "`full` or `delta`"),
+        ),
+        (
+            "keyframe-interval=0",
+            server.MSG_INVALID_VALUE.format(
+                "keyframe-interval", "a positive integer"
+            ),
+        ),
+        (
+            "keyframe-interval=often",
+            server.MSG_INVALID_VALUE.format(
+                "keyframe-interval", "a positive integer"
+            ),
+        ),
+        (
+            "colour=red",
+            server.MSG_CLIENT_ERR.format("unknown option(s): colour"),
+        ),
+    ],
+)
+def test_invalid_options(options, error):
+    async def main():
+        ws = FakeWebSocket()
+        handler = ws.connect()
+        ws.receive(f"new-grid {options} {BLINKER}")
+        assert await ws.wait_for(1) == [error]
+
+        # The client can try again.
+        ws.receive(f"new-grid frames=delta {BLINKER}")
+        assert (await ws.wait_for(5))[0] == "keyframe 0"
+        ws.close()
+        await handler
+
+    asyncio.run(main())
+
+
+def test_binary_frames():
+    async def main():
+        ws = FakeWebSocket()
+        handler = ws.connect()
+        ws.receive(
+            "new-grid frames=delta keyframe-interval=2 encoding=binary"
+            f" compression=zlib {BLINKER}"
+        )
+        [data] = await ws.wait_for(1)
+        assert frames.HEADER.unpack_from(data)[1] == frames.FLAG_ZLIB
+        frame = frames.decode(data)
+        assert frame.kind == frames.KIND_KEYFRAME
+        assert (frame.generation, frame.width, frame.height) == (0, 3, 3)
+        assert frame.cells == {P(1, 0), P(1, 1), P(1, 2)}
+
+        ws.receive("tick")
+        [data] = await ws.wait_for(1)
+        frame = frames.decode(data)
+        assert frame.kind == frames.KIND_DELTA
+        assert frame.generation == 1
+        assert set(frame.births) == {P(0, 1), P(2, 1)}
+        assert set(frame.deaths) == {P(1, 0), P(1, 2)}
+
+        ws.receive("tick")
+        [data] = await ws.wait_for(1)
+        frame = frames.decode(data)
+        assert (frame.kind, frame.generation) == (frames.KIND_KEYFRAME, 2)
+        assert frame.cells == {P(1, 0), P(1, 1), P(1, 2)}
+        ws.close()
+        await handler
+
+    asyncio.run(main())
+
+
+def test_binary_frames_limit_grid_size():
+    async def main():
+        ws = FakeWebSocket()
+        handler = ws.connect()
+        wide = "*" * (frames.MAX_SIZE + 1)
+        ws.receive(f"new-grid encoding=binary {wide}")
+        assert await ws.wait_for(1) == [
+            server.MSG_CLIENT_ERR.format(
+                "encoding=binary only supports grids up to"
+                f" {frames.MAX_SIZE} cells wide and high"
+            )
+        ]
+
+        # The same grid can still be sent as text.
+        ws.receive(f"new-grid frames=delta {wide}")
+        assert (await ws.wait_for(1))[0] == "keyframe 0"
+        ws.close()
+        await handler
+
+    asyncio.run(main())
+
+
+def test_tick_can_be_interrupted():
+    async def main():
+        ws = FakeWebSocket()
+        handler = ws.connect()
+        ws.receive(f"new-grid frames=delta {BLINKER}")
+        await ws.wait_for(5)
+
+        # Far more generations than can be stepped before the test times
+        # out, but other commands are still answered between slices.
+        ws.receive("tick 1000000")
+        await asyncio.sleep(0.1)
+        ws.receive("stats", "toggle-playback")
+        [stats] = await ws.wait_for(1)
+        assert stats.startswith("stats: population=3 ")
+
+        # Toggling playback cancelled the tick, and playback started from
+        # where it was.
+        keyframe, *_ = await ws.wait_for(5)
+        name, generation = keyframe.split()
+        assert name == "keyframe"
+        assert 0 < int(generation) < 1000000
+
+        ws.receive("toggle-playback")
+        ws.close()
+        await handler
+
+    asyncio.run(main())
+
+
+class SlowWebSocket(FakeWebSocket):
+    """A websocket whose sends wait until it's `unblocked`."""
+
+    def __init__(self):
+        super().__init__()
+        self.unblocked = asyncio.Event()
+
+    async def send(self, message):
+        await self.unblocked.wait()
+        await super().send(message)
+
+
+def test_sessions():
+    async def main():
+        a, b = FakeWebSocket(), FakeWebSocket()
+        a_handler = a.connect()
+        a.receive(f"new-grid session=shared {BLINKER}")
+        assert await a.wait_for(4) == [".*.", ".*.", ".*.", "\0"]
+        controller = server.SESSIONS["shared"]
+
+        # Joining needs no pattern, and the joining client is sent a
+        # keyframe.
+        b_handler = b.connect()
+        b.receive("new-grid session=shared frames=delta")
+        assert await b.wait_for(1) == [
+            server.MSG_CLIENT_ERR.format(
+                "session `shared` was created with frames=full"
+            )
+        ]
+        b.receive("new-grid session=shared frames=full")
+        assert await b.wait_for(4) == [".*.", ".*.", ".*.", "\0"]
+        assert len(controller.clients) == 2
+
+        # Either client controls the game, and both see every frame.
+        b.receive("tick")
+        horizontal = ["...", "***", "...", "\0"]
+        assert await a.wait_for(4) == horizontal
+        assert await b.wait_for(4) == horizontal
+
+        # Replies only go to the client that sent the command.
+        a.receive("stats", "no-such-command")
+        assert set(await a.wait_for(2)) == {
+            server.MSG_STATS.format(3, "0,1,2,1"),
+            server.MSG_INVALID_CMD.format("no-such-command"),
+        }
+        await asyncio.sleep(0.01)
+        assert b.sent == []
+
+        # The game lasts until its last client leaves.
+        a.close()
+        await a_handler
+        assert server.SESSIONS["shared"] is controller
+        b.close()
+        await b_handler
+        assert "shared" not in server.SESSIONS
+
+    asyncio.run(main())
+
+
+def test_join_while_game_is_busy():
+    async def main():
+        a, b = FakeWebSocket(), FakeWebSocket()
+        a_handler = a.connect()
+        a.receive(f"new-grid session=busy {BLINKER}")
+        await a.wait_for(4)
+        controller = server.SESSIONS["busy"]
+
+        # The last client leaves while another is waiting to join.
+        await controller.lock.acquire()
+        b_handler = b.connect()
+        b.receive("new-grid session=busy")
+        await wait_until(lambda: len(controller.clients) == 2)
+        a.close()
+        await a_handler
+        controller.lock.release()
+
+        assert await b.wait_for(4) == [".*.", ".*.", ".*.", "\0"]
+        assert server.SESSIONS["busy"] is controller
+        b.close()
+        await b_handler
+        assert "busy" not in server.SESSIONS
+
+    asyncio.run(main())
+
+
+def test_slow_client_drops_frames():
+    async def main():
+        fast, slow = FakeWebSocket(), SlowWebSocket()
+        fast_handler = fast.connect()
+        fast.receive(f"new-grid session=slow frames=delta {BLINKER}")
+        await fast.wait_for(5)
+        slow_handler = slow.connect()
+        slow.receive("new-grid session=slow")
+        # Wait for the slow client's keyframe to be taken off its queue.
+        controller = server.SESSIONS["slow"]
+        await wait_until(lambda: len(controller.clients) == 2)
+        client = next(
+            client for client in controller.clients if client.websocket is slow
+        )
+        await wait_until(client.queue.empty)
+
+        # One more frame than the queue holds, and one after that.
+        turns = server.CLIENT_QUEUE_SIZE + 2
+        for generation in range(1, turns + 1):
+            fast.receive("tick")
+            [delta] = await fast.wait_for(1)
+            assert parse_delta(delta)[0] == generation
+
+        # The frames that were waiting when the queue filled up were
+        # dropped, and replaced by a keyframe.
+        slow.unblocked.set()
+        messages = await slow.wait_for(11)
+        assert messages[:5] == ["keyframe 0", ".*.", ".*.", ".*.", "\0"]
+        assert messages[5:10] == [
+            f"keyframe {turns - 1}",
+            "...",
+            "***",
+            "...",
+            "\0",
+        ]
+        assert parse_delta(messages[10])[0] == turns
+
+        fast.close()
+        slow.close()
+        await asyncio.gather(fast_handler, slow_handler)
+        assert "slow" not in server.SESSIONS
+
+    asyncio.run(main())
@@ -0,0 +1,64 @@
+import io
+
+import conway
+from conway.grid import Point as P
+from conway.grid.cell_set import Grid
+from conway.terminal import CLEAR_SCREEN, DiffRenderer, changed_spans, move_to
+
+
+def test_changed_spans():
+    assert list(changed_spans("abcdef", "abcdef")) == []
+    assert list(changed_spans("abcdef", "xbcyzf")) == [(0, 1), (3, 5)]
+    assert list(changed_spans("abcdef", "abcdeX")) == [(5, 6)]
+
+
+def test_first_frame_is_drawn_in_full():
+    out = io.StringIO()
+    grid = Grid.from_str(".*.\n.*.\n.*.")
+    DiffRenderer(out).render(grid)
+
+    frame = out.getvalue()
+    assert frame.startswith(CLEAR_SCREEN + move_to(0, 0))
+    assert ".*.\n.*.\n.*." in frame
+
+
+def test_only_changed_cells_are_redrawn():
+    out = io.StringIO()
+    grid = Grid.from_str(".....\n..*..\n..*..\n..*..\n.....")
+    renderer = DiffRenderer(out)
+    renderer.render(grid)
+    out.seek(0)
+    out.truncate()
+
+    grid.tick()
+    renderer.render(grid, status="stats")
+
+    frame = out.getvalue()
+    assert CLEAR_SCREEN not in frame
+    # The blinker's ends died and its sides were born.
+    assert move_to(1, 2) + "." in frame
+    assert move_to(3, 2) + "." in frame
+    assert move_to(2, 1) + "*" in frame
+    assert move_to(2, 3) + "*" in frame
+    assert move_to(2, 2) not in frame
+    assert frame.endswith(move_to(5, 0) + "\x1b[Kstats\n")
+
+
+def test_unchanged_frame_only_moves_cursor():
+    out = io.StringIO()
+    grid = Grid.from_set({P(0, 0), P(1, 0), P(0, 1), P(1, 1)}, width=4)
+    renderer = DiffRenderer(out)
+    renderer.render(grid)
+    out.seek(0)
+    out.truncate()
+
+    grid.tick()
+    renderer.render(grid)
+    assert out.getvalue() == move_to(grid.height, 0) + "\x1b[K\n"
+
+
+def test_run_with_diff():
+    out = io.StringIO()
+    grid = Grid.from_str(".*.\n.*.\n.*.")
+    conway.run(grid, turns=2, delay=0, out=out, diff=True)
+    assert out.getvalue().count(CLEAR_SCREEN) == 1
@@ -0,0 +1,65 @@
+import pytest
+
+from conway.grid import Point as P
+from conway.grid.tiled import Grid, wrapped_slice
+
+from . import ToroidalGridTestMixin
+
+
+def test_wrapped_slice():
+    row = bytearray(b"\1\2\3\4")
+    assert wrapped_slice(row, 1, 3) == b"\2\3"
+    assert wrapped_slice(row, -1, 2) == b"\4\1\2"
+    assert wrapped_slice(row, 2, 5) == b"\3\4\1"
+    assert wrapped_slice(row, -1, 5) == b"\4\1\2\3\4\1"
+
+
+class TestGrid(ToroidalGridTestMixin):
+    GRID_CLS = Grid
+    ZEROED_CELLS = [bytearray(3), bytearray(3)]
+    # Small enough that most grids span several tiles.
+    GRID_KWARGS = {"tile_size": 3}
+
+    def test_init(self):
+        grid = Grid(width=70, height=40)
+        assert (grid.tiles_wide, grid.tiles_high) == (3, 2)
+        assert grid.changed_tiles == bytearray(b"\1" * 6)
+
+        grid = Grid(width=70, height=40, tile_size=10)
+        assert (grid.tiles_wide, grid.tiles_high) == (7, 4)
+
+        with pytest.raises(ValueError):
+            Grid(width=3, height=3, tile_size=0)
+
+    def test_from_set_keeps_tile_size(self):
+        grid = Grid.from_set({P(1, 1)}, width=9, height=9, tile_size=3)
+        assert grid.tile_size == 3
+        assert (grid.tiles_wide, grid.tiles_high) == (3, 3)
+
+    def test_skips_unchanged_tiles(self):
+        # A blinker in the middle of the top-left of 16 tiles.
+        grid = Grid.from_set(
+            {P(15, 16), P(16, 16), P(17, 16)}, width=128, height=128
+        )
+        grid.tick()
+        assert (grid.tiles_computed, grid.tiles_skipped) == (16, 0)
+
+        # Only the blinker's tile and its neighbors are computed.
+        grid.tick()
+        assert (grid.tiles_computed, grid.tiles_skipped) == (25, 7)
+
+    def test_setitem_marks_tile_changed(self):
+        # A block is a still life, so nothing changes after the first tick.
+        grid = Grid.from_set(
+            {P(40, 40), P(41, 40), P(40, 41), P(41, 41)}, width=96, height=96
+        )
+        grid.tick()
+        assert not any(grid.changed_tiles)
+        grid.tick()
+        assert (grid.tiles_computed, grid.tiles_skipped) == (9, 9)
+
+        grid[P(-1, -1)] = True
+        assert grid.changed_tiles[8]
+        grid.tick()
+        assert (grid.tiles_computed, grid.tiles_skipped) == (18, 9)
+        assert not grid[P(95, 95)]